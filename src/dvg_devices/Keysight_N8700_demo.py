@@ -13,17 +13,20 @@ print(__url__)
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List
 
 import qtpy
 from qtpy import QtCore, QtGui, QtWidgets as QtWid
-import pyvisa
 
 import dvg_pyqt_controls as controls
 from dvg_debug_functions import ANSI, dprint
 from dvg_qdeviceio import DAQ_TRIGGER
-from dvg_devices.Keysight_N8700_protocol_SCPI import Keysight_N8700
+from dvg_devices.Keysight_N8700_protocol_SCPI import (
+    Keysight_N8700,
+    default_rm,
+)
 from dvg_devices.Keysight_N8700_qdev import Keysight_N8700_qdev
 
 # Show debug info in terminal? Warning: Slow! Do not leave on unintentionally.
@@ -107,7 +110,7 @@ if __name__ == "__main__":
     #   Connect to and set up Keysight power supplies (PSU)
     # --------------------------------------------------------------------------
 
-    rm = pyvisa.ResourceManager()
+    rm = default_rm()
 
     psu1 = Keysight_N8700(VISA_ADDRESS_PSU_1, PATH_CONFIG_PSU_1, "PSU 1")
     psu2 = Keysight_N8700(VISA_ADDRESS_PSU_2, PATH_CONFIG_PSU_2, "PSU 2")
@@ -123,34 +126,38 @@ if __name__ == "__main__":
     #   Create application
     # --------------------------------------------------------------------------
 
-    main_thread = QtCore.QThread.currentThread()
-    if isinstance(main_thread, QtCore.QThread):
-        main_thread.setObjectName("MAIN")  # For DEBUG info
+    QtCore.QThread.currentThread().setObjectName("MAIN")  # For DEBUG info
 
-    if qtpy.PYQT6 or qtpy.PYSIDE6:
-        sys.argv += ["-platform", "windows:darkmode=0"]
-    app = QtWid.QApplication(sys.argv)
-    app.setStyle("Fusion")
+    # Reuse a possibly still running QApplication, e.g. when rerunning this
+    # script inside the same Spyder kernel
+    app = QtWid.QApplication.instance()
+    if app is None:
+        if qtpy.PYQT6 or qtpy.PYSIDE6:
+            sys.argv += ["-platform", "windows:darkmode=0"]
+        app = QtWid.QApplication(sys.argv)
+        app.setStyle("Fusion")
 
     # --------------------------------------------------------------------------
     #   Set up communication threads for the PSUs
     # --------------------------------------------------------------------------
 
-    psu_qdevs: List[Keysight_N8700_qdev] = []
-    for psu in psus:
-        psu_qdevs.append(
-            Keysight_N8700_qdev(
-                dev=psu,
-                DAQ_trigger=DAQ_TRIGGER.SINGLE_SHOT_WAKE_UP,
-                debug=DEBUG,
-            )
+    psu_qdevs: List[Keysight_N8700_qdev] = [
+        Keysight_N8700_qdev(
+            dev=psu,
+            DAQ_trigger=DAQ_TRIGGER.SINGLE_SHOT_WAKE_UP,
+            debug=DEBUG,
         )
+        for psu in psus
+    ]
 
     # DEBUG information
-    psu_qdevs[0].worker_DAQ.debug_color = ANSI.YELLOW
-    psu_qdevs[0].worker_jobs.debug_color = ANSI.CYAN
-    psu_qdevs[1].worker_DAQ.debug_color = ANSI.GREEN
-    psu_qdevs[1].worker_jobs.debug_color = ANSI.RED
+    # NOTE: `zip` truncates to the shortest list, so this is safe to run with
+    # fewer PSUs than there are colors listed.
+    for psu_qdev, color_DAQ, color_jobs in zip(
+        psu_qdevs, [ANSI.YELLOW, ANSI.GREEN], [ANSI.CYAN, ANSI.RED]
+    ):
+        psu_qdev.worker_DAQ.debug_color = color_DAQ
+        psu_qdev.worker_jobs.debug_color = color_jobs
 
     for psu_qdev in psu_qdevs:
         psu_qdev.start()
@@ -166,7 +173,10 @@ if __name__ == "__main__":
         for psu_qdev_ in psu_qdevs:
             psu_qdev_.wake_up_DAQ()
 
+    # A second-scale jitter is acceptable for this poll and lets the OS batch
+    # the wake-ups with other timers
     timer_psus = QtCore.QTimer()
+    timer_psus.setTimerType(QtCore.Qt.TimerType.VeryCoarseTimer)
     timer_psus.timeout.connect(trigger_update_psus)
     timer_psus.start(UPDATE_INTERVAL_MS)
 
@@ -176,14 +186,24 @@ if __name__ == "__main__":
 
     def about_to_quit():
         print("About to quit")
-        app.processEvents()
+        # Stop polling and only flush the already posted events, instead of
+        # spinning the event loop which could fire off yet another poll
+        timer_psus.stop()
+        QtCore.QCoreApplication.sendPostedEvents()
         for psu_qdev_ in psu_qdevs:
             psu_qdev_.quit()
-        for psu_ in psus:
+
+        # Closing a VISA session can block for a while. Close all PSUs
+        # concurrently so that we only wait for the slowest one.
+        def close_psu(psu_: Keysight_N8700):
             try:
                 psu_.close()
             except:
                 pass
+
+        with ThreadPoolExecutor(max_workers=len(psus)) as executor:
+            executor.map(close_psu, psus)
+
         try:
             rm.close()
         except:
@@ -16,12 +16,17 @@ __date__ = "23-05-2024"
 __version__ = "1.5.0"
 # pylint: disable=missing-function-docstring, multiple-statements, broad-except
 
+import asyncio
 import os
+import re
 import time
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 from pathlib import Path
-from typing import Union, Tuple, List
+from typing import Union, Tuple, List, Dict, Sequence
 
 import pyvisa
+from pyvisa import constants as visa_constants
 import numpy as np
 
 from dvg_debug_functions import print_fancy_traceback
@@ -30,12 +35,188 @@ from dvg_pid_controller import PID_Controller
 # 'No error left' reply from the PSU
 STR_NO_ERROR = "ERR 0"
 
+# Extracts the error description from an error reply like "ERR -222 ..."
+RE_ERROR = re.compile(r"ERR\s*(.*?)\s*$")
+
+# Matches the separators between error replies of a compound 'err?' query
+RE_ERROR_SEPARATOR = re.compile(r";(?=ERR)")
+
+# Number of telemetry samples kept in 'State.history'
+HISTORY_LENGTH = 1000
+
+# Columns of 'State.history'
+HISTORY_COLUMNS = ("V_meas", "I_meas", "P_meas", "V_source", "I_source")
+
+# Separator lines printed by 'report()'
+STR_SEP_1 = chr(0x2015) * 26
+STR_SEP_2 = chr(0x2014) * 26
+
+# Number of errors to pop from the error queue per compound query
+ERROR_BATCH_SIZE = 8
+
 # VISA settings
 VISA_TIMEOUT = 4000  # 4000 [msec]
 
+# Minimum VISA timeout needed to wait for a reset to complete
+RESET_TIMEOUT = 2000  # 2000 [msec]
+
+# Maximum time to block on a service request (SRQ) in
+# 'wait_for_OPC_indefinitely()', before falling back to polling the status byte
+SRQ_TIMEOUT = 10000  # 10000 [msec]
+
 # Default config file path
 PATH_CONFIG = Path(os.getcwd() + "/config/settings_Keysight_PSU.txt")
 
+# Contents of the config file, formatted as:
+#   CONFIG_FORMAT(V_source, I_source, P_source, OVP_level, ENA_OCP)
+CONFIG_FORMAT = "{:.2f}\n{:.3f}\n{:.2f}\n{:.2f}\n{}".format
+
+# Minimum time between two deferred writes of the config file, see
+# 'write_config_file(defer=True)'
+CONFIG_FLUSH_INTERVAL = 0.5  # 0.5 [s]
+
+# Bits of the questionable condition status register:
+#   (State member, bit mask, short label)
+STATUS_QC_BITS = (
+    ("status_QC_OV", 1, "OV"),
+    ("status_QC_OC", 2, "OC"),
+    ("status_QC_PF", 4, "PF"),
+    ("status_QC_OT", 16, "OT"),
+    ("status_QC_INH", 512, "INH"),
+    ("status_QC_UNR", 1024, "UNR"),
+)
+
+# Bits of the operation condition status register:
+#   (State member, bit mask, short label)
+STATUS_OC_BITS = (
+    ("status_OC_WTG", 32, "WTG"),
+    ("status_OC_CV", 256, "CV"),
+    ("status_OC_CC", 1024, "CC"),
+)
+
+# NOTE: All SCPI commands in this module use the shortest accepted form, to
+# save bytes on the wire. I.e. optional nodes like '[SOURce:]' and '[:LEVel]'
+# are left out: 'volt:prot' is short for 'SOURce:VOLTage:PROTection:LEVel'.
+
+# Templates of the parametric setter commands, pre-encoded to skip the string
+# encoding layer of pyvisa. Formatted directly as bytes, e.g.:
+#   CMD_SOUR_VOLT % voltage_V
+CMD_SOUR_VOLT = b"volt %.5f"
+CMD_SOUR_CURR = b"curr %.5f"
+CMD_SOUR_VOLT_PROT_LEV = b"volt:prot %.5f"
+
+# Fixed commands that get sent over and over again. Their encoded form will be
+# cached at 'connect()'.
+FREQUENT_COMMANDS = (
+    "meas:volt?;:meas:curr?",
+    "stat:ques:cond?;:stat:oper:cond?",
+    "*opc",
+    "*opc?",
+    "*esr?",
+    "err?",
+)
+
+# Settings that only change when we set them ourselves. Their last known
+# value gets reused by the 'query_...()' methods, unless it might have changed
+# since. See '_dirty'. NOTE: Setting the voltage, current or OVP level does not
+# make its value known, because the device rejects a value outside of its
+# range, which for the voltage and OVP level depend on each other.
+CACHED_SETTINGS = ("V_source", "I_source", "OVP_level", "ENA_OCP")
+
+# Compound query of 'query_settings_and_status()'. The error query must come
+# last, as its reply is not split any further. See '_query_compound()'.
+QUERIES_SETTINGS_AND_STATUS = (
+    "volt:prot?",
+    "volt?",
+    "curr?",
+    "curr:prot:stat?",
+    "stat:ques:cond?",
+    "stat:oper:cond?",
+    "err?",
+)
+
+# Compound query of 'query_meas_and_status()': All that needs to be read out
+# periodically, see 'Keysight_N8700_qdev.DAQ_function()'. The error query must
+# come last, as its reply is not split any further. See '_query_compound()'.
+QUERIES_MEAS_AND_STATUS = (
+    "meas:volt?",
+    "meas:curr?",
+    "outp?",
+    "curr:prot:stat?",
+    "stat:ques:cond?",
+    "stat:oper:cond?",
+    "err?",
+)
+
+# Identical VISA I/O errors get printed at most once per this interval, to
+# prevent a disconnected PSU from flooding the terminal
+ERROR_PRINT_INTERVAL = 5  # 5 [s]
+
+# Maximum number of encoded messages to cache, to prevent the cache from growing
+# indefinitely by messages that contain ever-changing values
+MAX_CMD_CACHE_SIZE = 128
+
+# Process-wide VISA ResourceManager, lazily created by `default_rm()`
+_DEFAULT_RM: Union[pyvisa.ResourceManager, None] = None
+
+
+def default_rm() -> pyvisa.ResourceManager:
+    """Return a VISA ResourceManager shared by the whole process. It is created
+    on first use and recreated when the previous one got closed. Constructing a
+    ResourceManager loads the VISA library and is slow, so reusing it pays off
+    when a script gets rerun inside the same interpreter session, e.g. Spyder.
+    """
+    global _DEFAULT_RM  # pylint: disable=global-statement
+
+    if _DEFAULT_RM is not None:
+        try:
+            _DEFAULT_RM.session  # pylint: disable=pointless-statement
+        except pyvisa.errors.InvalidSession:
+            _DEFAULT_RM = None  # Got closed. Recreate.
+
+    if _DEFAULT_RM is None:
+        _DEFAULT_RM = pyvisa.ResourceManager()
+
+    return _DEFAULT_RM
+
+
+def stack_states(
+    psus: Sequence["Keysight_N8700"],
+    columns: Sequence[str] = HISTORY_COLUMNS,
+) -> np.ndarray:
+    """Gather the 'State' members listed by 'columns' of multiple PSUs into a
+    single 2-D array with one row per PSU, in the order of 'psus'. This allows
+    for vectorized operations over a rack of PSUs, e.g.:
+
+        stack_states(psus)[:, HISTORY_COLUMNS.index("V_meas")].mean()
+
+    Returns: Array of shape (len(psus), len(columns)).
+    """
+    get_row = attrgetter(*columns)
+    rows = [get_row(psu.state) for psu in psus]
+    return np.array(rows, dtype=float).reshape(len(psus), len(columns))
+
+
+def poll_psus(psus: Sequence["Keysight_N8700"]) -> List[bool]:
+    """Measure the output voltage and current of multiple PSUs concurrently,
+    by calling 'query_VI_meas()' on each from its own thread. The total time
+    then amounts to that of the slowest PSU, instead of the sum over all.
+
+    Each PSU has its own VISA session, so this overlaps well over USB and
+    TCP/IP. PSUs that share a single GPIB bus will still be serviced one after
+    another by the bus itself.
+
+    NOTE: Not meant for PSUs that are already being serviced by a running
+    'Keysight_N8700_qdev', as this bypasses their 'mutex'.
+
+    Returns: List of the success per PSU, in the order of 'psus'.
+    """
+    if not psus:
+        return []
+
+    with ThreadPoolExecutor(max_workers=len(psus)) as executor:
+        return list(executor.map(lambda psu: psu.query_VI_meas(), psus))
+
 
 class Keysight_N8700:
     class State:
@@ -44,55 +225,137 @@ class Keysight_N8700:
         that the last query was unsuccessful in communication.
         """
 
-        # fmt: off
-        V_source: float = 0     # Voltage to be sourced [V]
-        I_source: float = 0     # Current to be sourced [A]
-        P_source: float = 0     # Power to be sourced, when PID controller is on [W]
-        ENA_PID : bool = False  # Is the PID controller on the power output enabled?
-
-        V_meas: float = np.nan  # Measured output voltage [V]
-        I_meas: float = np.nan  # Measured output current [A]
-        P_meas: float = np.nan  # Derived output power    [W]
-
-        OVP_level : float = np.nan  # Over-voltage protection level [V]
-        ENA_OCP   : bool = False    # Is over-current protection enabled?
-        ENA_output: bool= False     # Is power output enabled (by software)?
-        # fmt: on
+        # Fixed set of members, for faster attribute access
+        __slots__ = (
+            "V_source",
+            "I_source",
+            "P_source",
+            "ENA_PID",
+            "V_meas",
+            "I_meas",
+            "P_meas",
+            "OVP_level",
+            "ENA_OCP",
+            "ENA_output",
+            "error",
+            "all_errors",
+            "status_QC",
+            "status_OC",
+            "status_QC_OV",
+            "status_QC_OC",
+            "status_QC_PF",
+            "status_QC_OT",
+            "status_QC_INH",
+            "status_QC_UNR",
+            "status_OC_WTG",
+            "status_OC_CV",
+            "status_OC_CC",
+            "history",
+            "history_cursor",
+        )
+
+        def __init__(self):
+            # fmt: off
+            self.V_source: float = 0     # Voltage to be sourced [V]
+            self.I_source: float = 0     # Current to be sourced [A]
+            self.P_source: float = 0     # Power to be sourced, when PID controller is on [W]
+            self.ENA_PID : bool = False  # Is the PID controller on the power output enabled?
+
+            self.V_meas: float = np.nan  # Measured output voltage [V]
+            self.I_meas: float = np.nan  # Measured output current [A]
+            self.P_meas: float = np.nan  # Derived output power    [W]
+
+            self.OVP_level : float = np.nan  # Over-voltage protection level [V]
+            self.ENA_OCP   : bool = False    # Is over-current protection enabled?
+            self.ENA_output: bool= False     # Is power output enabled (by software)?
+            # fmt: on
 
-        # The single error string retreived from the error queue of the device.
-        # None indicates no error is left in the queue.
-        error: Union[str, None] = None
+            # The single error string retreived from the error queue of the
+            # device. None indicates no error is left in the queue.
+            self.error: Union[str, None] = None
 
-        # This list of strings is provided to be able to store all errors from
-        # the device queue. This list is populated by calling 'query_error'
-        # until no error is left in the queue. This list can then be printed to
-        # screen or GUI and the user should 'acknowledge' the list, after which
-        # the list can be emptied (=[]) again.
-        all_errors: List[str] = []
+            # This list of strings is provided to be able to store all errors
+            # from the device queue. This list is populated by calling
+            # 'query_error' until no error is left in the queue. This list can
+            # then be printed to screen or GUI and the user should 'acknowledge'
+            # the list, after which the list can be emptied (=[]) again.
+            self.all_errors: List[str] = []
 
-        # Questionable condition status registers
-        # fmt: off
-        status_QC_OV : bool = False  # Output disabled by over-voltage protection
-        status_QC_OC : bool = False  # Output disabled by over-current protection
-        status_QC_PF : bool = False  # Output disabled because AC power failed
-        status_QC_OT : bool = False  # Output disabled by over-temperature protection
-        status_QC_INH: bool = False  # Output turned off by external J1 inhibit signal (ENABLE)
-        status_QC_UNR: bool = False  # The output is unregulated
-
-        # Operation condition status registers
-        status_OC_WTG: bool = False  # Unit waiting for transient trigger
-        status_OC_CV : bool = False  # Output in constant voltage
-        status_OC_CC : bool = False  # Output in constant current
-        # fmt: on
+            # Raw codes of the condition status registers, decoded into the
+            # separate flags below
+            self.status_QC: int = 0
+            self.status_OC: int = 0
+
+            # Questionable condition status registers
+            # fmt: off
+            self.status_QC_OV : bool = False  # Output disabled by over-voltage protection
+            self.status_QC_OC : bool = False  # Output disabled by over-current protection
+            self.status_QC_PF : bool = False  # Output disabled because AC power failed
+            self.status_QC_OT : bool = False  # Output disabled by over-temperature protection
+            self.status_QC_INH: bool = False  # Output turned off by external J1 inhibit signal (ENABLE)
+            self.status_QC_UNR: bool = False  # The output is unregulated
+
+            # Operation condition status registers
+            self.status_OC_WTG: bool = False  # Unit waiting for transient trigger
+            self.status_OC_CV : bool = False  # Output in constant voltage
+            self.status_OC_CC : bool = False  # Output in constant current
+            # fmt: on
+
+            # Rolling history of the telemetry, appended to on every
+            # 'query_VI_meas()'. One row per sample, with the columns as listed
+            # by 'HISTORY_COLUMNS'. The newest row sits at index
+            # '(history_cursor - 1) % HISTORY_LENGTH'. Rows that have not been
+            # written yet read numpy.nan.
+            self.history: np.ndarray = np.full(
+                (HISTORY_LENGTH, len(HISTORY_COLUMNS)), np.nan
+            )
+            self.history_cursor: int = 0
+
+        def set_VI_meas(self, V_meas: float, I_meas: float):
+            """Store a new measurement of the output voltage and current,
+            derive the output power from it and append it to 'history'. The
+            single place where 'P_meas' gets computed, so that it always
+            matches 'V_meas' and 'I_meas'.
+            """
+            self.V_meas = V_meas
+            self.I_meas = I_meas
+            self.P_meas = V_meas * I_meas
+            self.append_history()
+
+        def append_history(self):
+            """Store the current telemetry as the newest row of 'history'."""
+            self.history[self.history_cursor % HISTORY_LENGTH] = (
+                self.V_meas,
+                self.I_meas,
+                self.P_meas,
+                self.V_source,
+                self.I_source,
+            )
+            self.history_cursor += 1
+
+        def get_history(self) -> np.ndarray:
+            """Return a copy of the written rows of 'history' in chronological
+            order, oldest first.
+            """
+            if self.history_cursor <= HISTORY_LENGTH:
+                return self.history[: self.history_cursor].copy()
+
+            return np.roll(
+                self.history, -(self.history_cursor % HISTORY_LENGTH), axis=0
+            )
 
     class Config:
-        # fmt: off
-        V_source : float = 120       # Voltage to be sourced [V]
-        I_source : float = 1         # Current to be sourced [A]
-        P_source : float = 0         # Power   to be sourced [W]
-        OVP_level: float = 126       # Over-voltage protection level [V]
-        ENA_OCP  : bool  = True      # Is over-current protection enabled?
-        # fmt: on
+        # Fixed set of members, for faster attribute access
+        __slots__ = ("V_source", "I_source", "P_source", "OVP_level", "ENA_OCP")
+
+        def __init__(self):
+            # fmt: off
+            self.V_source : float = 120       # Voltage to be sourced [V]
+            self.I_source : float = 1         # Current to be sourced [A]
+            self.P_source : float = 0         # Power   to be sourced [W]
+            self.OVP_level: float = 126       # Over-voltage protection level [V]
+            self.ENA_OCP  : bool  = True      # Is over-current protection enabled?
+            # fmt: on
 
     # --------------------------------------------------------------------------
     #   __init__
@@ -109,7 +372,7 @@ class Keysight_N8700:
             visa_address (`str`):
                 VISA device address.
 
-            path_config (`pathlib.Path`):
+            path_config (`pathlib.Path` | `str`):
                 Path to the configuration file.
         """
         self._visa_address = visa_address
@@ -119,24 +382,96 @@ class Keysight_N8700:
         # Placeholder for the VISA device instance
         self.device: Union[pyvisa.resources.MessageBasedResource, None] = None
 
-        # Is the connection to the device alive?
-        self.is_alive: bool = False
+        # Encoded write termination of the VISA device, used by 'write_raw()'
+        self._write_termination: bytes = b"\n"
+
+        # Cache of encoded messages including termination, used by 'write()'
+        # and 'query()'
+        self._cmd_cache: Dict[str, bytes] = {}
+
+        # Is queueing of service request (SRQ) events enabled on the current
+        # VISA session? See 'prepare_wait_for_OPC_indefinitely()'.
+        self._SRQ_enabled: bool = False
+
+        # Did an SRQ fail to arrive on the current VISA session? Some setups,
+        # like behind a USB isolator, never deliver it. Then the status byte
+        # gets polled right away, instead of waiting for 'SRQ_TIMEOUT' first
+        # on every call of 'wait_for_OPC_indefinitely()'.
+        self._SRQ_unreliable: bool = False
+
+        # Must the setting be queried from the device (True), or is its value
+        # in 'state' known to be up to date (False)? See 'CACHED_SETTINGS'.
+        self._dirty: Dict[str, bool] = dict.fromkeys(CACHED_SETTINGS, True)
+
+        # Might the device still be busy with operations that we sent? Cleared
+        # by a successful 'wait_for_OPC()' or 'wait_for_OPC_indefinitely()'.
+        self._ops_pending: bool = True
+
+        # Time of the last print and the number of suppressed repeats per
+        # distinct VISA I/O error. See '_print_VISA_error()'.
+        self._VISA_error_prints: Dict[str, Tuple[float, int]] = {}
+
+        # Is the connection to the device alive? See property 'is_alive'.
+        self._is_alive: bool = False
 
         # Container for the process and measurement variables
         self.state = self.State()
         self.config = self.Config()
 
         # Location of the configuration file
-        self.path_config: Path = path_config
+        self.path_config: Path = Path(path_config)
+
+        # Contents of the config file as last read successfully, keyed by its
+        # path, modification time and size, to skip parsing an unchanged file
+        self._config_cache: Union[Tuple[tuple, tuple], None] = None
+
+        # Config file and its contents as last written successfully, to skip
+        # rewriting an unchanged config
+        self._last_config_blob: Union[Tuple[Path, bytes], None] = None
+
+        # Is there a deferred config change still waiting to be written, and
+        # when was the config file last written? See 'write_config_file()'.
+        self._config_dirty: bool = False
+        self._config_last_flush: float = 0.0
 
         # Placeholder for a future PID controller on the power output
         self.PID_power = PID_Controller(Kp=0, Ki=0, Kd=0)
 
+    # --------------------------------------------------------------------------
+    #   is_alive
+    # --------------------------------------------------------------------------
+
+    @property
+    def is_alive(self) -> bool:
+        """Is the connection to the device alive?
+
+        While alive, the I/O methods 'write()', 'write_raw()' and 'query()'
+        are rebound to variants that skip checking for a live connection on
+        every call. Marking the device as not alive restores the checked
+        variants.
+        """
+        return self._is_alive
+
+    @is_alive.setter
+    def is_alive(self, flag: bool):
+        self._is_alive = flag
+        if flag and self.device is not None:
+            self.write = self._write_fast
+            self.write_raw = self._write_raw_fast
+            self.query = self._query_fast
+        else:
+            self.__dict__.pop("write", None)
+            self.__dict__.pop("write_raw", None)
+            self.__dict__.pop("query", None)
+
     # --------------------------------------------------------------------------
     #   close
     # --------------------------------------------------------------------------
 
     def close(self):
+        # Do not lose a config change that got deferred
+        self.flush_config()
+
         if (not self.is_alive) or (self.device is None):
             # print("ERROR: Device is already closed.")
             pass  # Remain silent. Device is already closed.
@@ -148,14 +483,17 @@ class Keysight_N8700:
     #   connect
     # --------------------------------------------------------------------------
 
-    def connect(self, rm: pyvisa.ResourceManager) -> bool:
+    def connect(
+        self, rm: Union[pyvisa.ResourceManager, None] = None
+    ) -> bool:
         """Try to connect to the PSU over VISA at the given address. When
         successful the VISA device instance will be stored in member 'device'
         and its identity is queried and stored in '_idn'.
 
         Args:
-            rm `(pyvisa.ResourceManager)`:
-                Instance of VISA ResourceManager.
+            rm `(pyvisa.ResourceManager | None)`:
+                Instance of VISA ResourceManager. When None, the process-wide
+                instance returned by `default_rm()` will be used.
 
         Returns: True if successful, False otherwise.
         """
@@ -164,9 +502,19 @@ class Keysight_N8700:
         print("Connect to: Keysight N8700 series PSU")
         print(f"  @ {self._visa_address} : ", end="")
 
+        if rm is None:
+            rm = default_rm()
+
         try:
-            device = rm.open_resource(self._visa_address, timeout=VISA_TIMEOUT)
-            device.clear()
+            # Set the terminations explicitly, instead of relying on the
+            # defaults of pyvisa. This also saves sending a superfluous
+            # carriage return with every message.
+            device = rm.open_resource(
+                self._visa_address,
+                timeout=VISA_TIMEOUT,
+                read_termination="\n",
+                write_termination="\n",
+            )
         except pyvisa.VisaIOError:
             print("Could not open resource.\n")
             return False
@@ -179,10 +527,30 @@ class Keysight_N8700:
 
         print("Success!")
         self.device = device
+        self._SRQ_enabled = False
+        self._SRQ_unreliable = False
+        self._ops_pending = True
+        self._dirty = dict.fromkeys(CACHED_SETTINGS, True)
+        self._write_termination = device.write_termination.encode(
+            device.encoding
+        )
+        self._cmd_cache = {}
+        for msg_str in FREQUENT_COMMANDS:
+            self._encode(msg_str)
         self.is_alive = True
 
-        _success, reply = self.query("*idn?")
-        self.wait_for_OPC()
+        # Clearing the status and asking for the identity in one go serves as
+        # our first exchange. '*cls' is handled immediately by the device, so
+        # there is no need to wait for the operation to complete.
+        _success, reply = self.query("*cls;*idn?")
+        if not isinstance(reply, str):
+            # Perhaps a stale exchange of a prior session is still pending.
+            # Clear the device's input and output buffers and try once more.
+            try:
+                device.clear()
+            except pyvisa.VisaIOError:
+                return False
+            _success, reply = self.query("*cls;*idn?")
 
         if not isinstance(reply, str):
             return False
@@ -191,6 +559,47 @@ class Keysight_N8700:
         print(f"  {self._idn}\n")
         return True
 
+    # --------------------------------------------------------------------------
+    #   reopen
+    # --------------------------------------------------------------------------
+
+    def reopen(self) -> bool:
+        """Try to restore communication over the VISA session that is still
+        open from an earlier 'connect()', e.g. after a transient I/O error
+        caused the connection to be flagged as lost. Much faster than calling
+        'connect()' again, as opening a VISA resource can take seconds.
+
+        Returns: True if successful, False otherwise. In the latter case, fall
+            back to 'close()' and 'connect()'.
+        """
+        if self.device is None:
+            return False
+
+        # NOTE: Also catch 'pyvisa.errors.InvalidSession', which is not a
+        # 'VisaIOError' and gets raised when the session got closed already,
+        # e.g. by 'close()'
+        try:
+            self.device.clear()
+        except pyvisa.errors.Error:
+            self.is_alive = False
+            return False
+
+        self.is_alive = True
+        self._SRQ_unreliable = False
+        self._dirty = dict.fromkeys(CACHED_SETTINGS, True)
+
+        try:
+            _success, reply = self.query("*cls;*idn?")
+        except pyvisa.errors.Error:
+            reply = None
+
+        if reply != self._idn:
+            # No reply, or a different device is answering
+            self.is_alive = False
+            return False
+
+        return True
+
     # --------------------------------------------------------------------------
     #   begin
     # --------------------------------------------------------------------------
@@ -218,24 +627,18 @@ class Keysight_N8700:
         success = True
         success &= self.set_PON_off()  # Force power-on state off for safety
 
-        self.wait_for_OPC()
-        # BELOW IS COMMENTED OUT because .stb fails intermittently, perhaps due
-        # to the USB isolator
-        # self.prepare_wait_for_OPC_indefinitely()
-
-        success &= self.query_OVP_level()
-        success &= self.query_V_source()
-        success &= self.query_I_source()
-        success &= self.query_ENA_OCP()
-        success &= self.query_status_QC()
-        success &= self.query_status_OC()
-
-        self.query_all_errors_in_queue()
-
-        # BELOW IS COMMENTED OUT because .stb fails intermittently, perhaps due
-        # to the USB isolator
-        # self.wait_for_OPC_indefinitely()
-        self.wait_for_OPC()
+        # No need to wait for the operation to complete here. We only block
+        # once at the very end.
+        self.prepare_wait_for_OPC_indefinitely()
+
+        success &= self.query_settings_and_status()
+
+        if self.state.error is not None:
+            # More errors might be left in the queue. Retrieve all.
+            self.state.all_errors.append(self.state.error)
+            self.query_all_errors_in_queue()
+
+        self.wait_for_OPC_indefinitely()
 
         return success
 
@@ -260,32 +663,48 @@ class Keysight_N8700:
         # Clear device's input and output buffers
         self.device.clear()
 
-        success = True
-        success &= self.clear_and_reset()
-        success &= self.set_PON_off()
-        success &= self.set_OVP_level(self.config.OVP_level)
-        success &= self.set_V_source(self.config.V_source)
-        success &= self.set_I_source(self.config.I_source)
+        # Clear, reset, prepare for 'wait_for_OPC_indefinitely()' and send all
+        # settings as one compound SCPI message, saving a round-trip per
+        # command
+        self.state.OVP_level = self.config.OVP_level
+        self.state.V_source = self.config.V_source
+        self.state.I_source = self.config.I_source
         self.state.P_source = self.config.P_source
         self.state.ENA_PID = False
-        success &= self.set_ENA_OCP(self.config.ENA_OCP)
-
-        self.wait_for_OPC()
-        self.prepare_wait_for_OPC_indefinitely()
+        self._dirty = dict.fromkeys(CACHED_SETTINGS, True)
+        success = self._write_compound(
+            "*cls;*rst;*ese 1;*sre 32;outp:pon:stat rst",
+            f"volt:prot {self.config.OVP_level:.5f}",
+            f"volt {self.config.V_source:.5f}",
+            f"curr {self.config.I_source:.5f}",
+            f"curr:prot:stat {'on' if self.config.ENA_OCP else 'off'}",
+        )
+        if success:
+            self.state.ENA_OCP = self.config.ENA_OCP
 
-        success &= self.query_OVP_level()
-        success &= self.query_V_source()
-        success &= self.query_I_source()
-        success &= self.query_ENA_OCP()
-        success &= self.query_status_QC()
-        success &= self.query_status_OC()
+        # The reset can take a long time to complete
+        self.wait_for_OPC_indefinitely()
 
-        self.query_all_errors_in_queue()
+        success &= self.query_settings_and_status()
 
-        self.wait_for_OPC_indefinitely()
+        if self.state.error is not None:
+            # More errors might be left in the queue. Retrieve all.
+            self.state.all_errors.append(self.state.error)
+            self.query_all_errors_in_queue()
 
         return success
 
+    def reinitialize_from_config(self) -> bool:
+        """Read in the config file and reinitialize the PSU with it. A single
+        call, so that the file I/O can be offloaded to a worker thread along
+        with the reinitialization.
+
+        Returns: True if all messages were sent and received successfully,
+            False otherwise.
+        """
+        self.read_config_file()
+        return self.reinitialize()
+
     # --------------------------------------------------------------------------
     #   write
     # --------------------------------------------------------------------------
@@ -306,11 +725,82 @@ class Keysight_N8700:
             print("ERROR: Device is not connected yet or already closed.")
             return False
 
+        return self._write_fast(msg_str)
+
+    def _write_fast(self, msg_str) -> bool:
+        """Like 'write()', but without checking for a live connection."""
+        self._ops_pending = True
         try:
-            self.device.write(msg_str)
+            self.device.write_raw(self._encode(msg_str))  # type: ignore
         except pyvisa.VisaIOError as err:
             # Print error and struggle on
-            print_fancy_traceback(err)
+            self._print_VISA_error(err)
+            return False
+        except Exception as err:
+            raise err
+
+        return True
+
+    def _print_VISA_error(self, err: pyvisa.VisaIOError):
+        """Print the traceback of a VISA I/O error, unless the same error got
+        printed less than 'ERROR_PRINT_INTERVAL' seconds ago. Formatting the
+        traceback is slow and would otherwise flood the terminal when the
+        connection is lost. Must be called from within the 'except' block.
+        """
+        key = str(err)
+        now = time.perf_counter()
+        last_print, N_suppressed = self._VISA_error_prints.get(key, (-1e9, 0))
+        if now - last_print < ERROR_PRINT_INTERVAL:
+            self._VISA_error_prints[key] = (last_print, N_suppressed + 1)
+            return
+
+        self._VISA_error_prints[key] = (now, 0)
+        print_fancy_traceback(err)
+        if N_suppressed:
+            print(f"  (+ {N_suppressed} identical errors at {self.name})")
+
+    def _write_compound(self, *commands: str) -> bool:
+        """Send all 'commands' as one compound SCPI message, saving a
+        round-trip per command. Each command starts from the root of the
+        command tree.
+
+        Returns: True if the message was sent successfully, False otherwise.
+        """
+        return self.write(";:".join(commands))
+
+    # --------------------------------------------------------------------------
+    #   write_raw
+    # --------------------------------------------------------------------------
+
+    def write_raw(self, msg_bytes: bytes) -> bool:
+        """Try to write an already encoded command to the device, bypassing the
+        string encoding layer of pyvisa. The write termination gets appended.
+
+        Args:
+            msg_bytes (`bytes`):
+                Message to be sent, without termination.
+
+        Returns: True if the message was sent successfully, False otherwise.
+            NOTE: It does not indicate whether the message made sense to the
+            device.
+        """
+
+        if not self.is_alive or self.device is None:
+            print("ERROR: Device is not connected yet or already closed.")
+            return False
+
+        return self._write_raw_fast(msg_bytes)
+
+    def _write_raw_fast(self, msg_bytes: bytes) -> bool:
+        """Like 'write_raw()', but without checking for a live connection."""
+        self._ops_pending = True
+        try:
+            self.device.write_raw(  # type: ignore
+                msg_bytes + self._write_termination
+            )
+        except pyvisa.VisaIOError as err:
+            # Print error and struggle on
+            self._print_VISA_error(err)
             return False
         except Exception as err:
             raise err
@@ -336,34 +826,114 @@ class Keysight_N8700:
             reply (`str` | `None`):
                 Reply received from the device. None if unsuccessful.
         """
-        success = False
-        reply = None
-
         if not self.is_alive or self.device is None:
             print("ERROR: Device is not connected yet or already closed.")
-            return success, reply
+            return False, None
+
+        return self._query_fast(msg_str)
+
+    def _query_fast(self, msg_str: str) -> Tuple[bool, Union[str, None]]:
+        """Like 'query()', but without checking for a live connection."""
+        success = False
+        reply = None
 
         try:
-            reply = self.device.query(msg_str)
+            self.device.write_raw(self._encode(msg_str))  # type: ignore
+            reply = self.device.read_raw()  # type: ignore
         except pyvisa.VisaIOError as err:
             # Print error and struggle on
-            print_fancy_traceback(err)
+            self._print_VISA_error(err)
         except Exception as err:
             raise err
         else:
-            reply = reply.strip()
+            reply = reply.decode(self.device.encoding).strip()  # type: ignore
             success = True
 
         return success, reply
 
+    def _encode(self, msg_str: str) -> bytes:
+        """Return the message encoded for the device, including the write
+        termination. Looked up from a cache when possible, which saves pyvisa
+        from having to encode the same message over and over again.
+        """
+        try:
+            return self._cmd_cache[msg_str]
+        except KeyError:
+            pass
+
+        msg_bytes = (
+            msg_str.encode(self.device.encoding)  # type: ignore
+            + self._write_termination
+        )
+        if len(self._cmd_cache) < MAX_CMD_CACHE_SIZE:
+            self._cmd_cache[msg_str] = msg_bytes
+
+        return msg_bytes
+
+    def _query_compound(self, *queries: str) -> Union[List[str], None]:
+        """Send all 'queries' as one compound SCPI message, saving a
+        round-trip per query, and split the compound reply.
+
+        The reply to the last query is not split any further, so that it may
+        contain semicolons itself, like an error description can.
+
+        Returns: The list of replies, one per query, or None if unsuccessful.
+        """
+        _success, reply = self.query(";:".join(queries))
+        if not isinstance(reply, str):
+            return None
+
+        replies = reply.split(";", len(queries) - 1)
+        if len(replies) != len(queries):
+            print(f"ERROR: Unexpected reply from {self.name}: {reply}")
+            return None
+
+        return replies
+
+    # --------------------------------------------------------------------------
+    #   asyncio front-end
+    # --------------------------------------------------------------------------
+
+    """The methods below run their blocking counterpart in the default executor
+    of the running asyncio event loop, so that several PSUs can be talked to
+    concurrently, e.g.:
+
+        await asyncio.gather(*(psu.abegin() for psu in psus))
+
+    A VISA session is not thread-safe. Hence, never await more than one of
+    these calls at a time on the same instance. Different instances are fine.
+    """
+
+    async def awrite(self, msg_str: str) -> bool:
+        """Non-blocking version of 'write()'."""
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self.write, msg_str)
+
+    async def aquery(self, msg_str: str) -> Tuple[bool, Union[str, None]]:
+        """Non-blocking version of 'query()'."""
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self.query, msg_str)
+
+    async def abegin(self) -> bool:
+        """Non-blocking version of 'begin()'."""
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self.begin)
+
     # --------------------------------------------------------------------------
     #   System status related
     # --------------------------------------------------------------------------
 
-    def clear_and_reset(self) -> bool:
+    def clear_and_reset(self, defer_OPC: bool = False) -> bool:
         """Clear device status and reset. Return when this operation has
         completed on the device. Blocking.
 
+        Args:
+            defer_OPC (`bool`):
+                When True, return immediately after sending the message and
+                leave it up to the caller to wait for the operation to complete,
+                e.g. by a single 'wait_for_OPC_indefinitely()' at the end of a
+                longer sequence of commands. Non-blocking.
+
         Returns: True if the message was sent successfully, False otherwise.
         """
 
@@ -371,18 +941,30 @@ class Keysight_N8700:
             print("ERROR: Device is not connected yet or already closed.")
             return False
 
-        # The reset operation can take a long time to complete. Momentarily
-        # increase the timeout to 2000 msec if necessary.
-        self.device.timeout = max(self.device.timeout, 2000)
+        # The reset changes all settings
+        self._dirty = dict.fromkeys(CACHED_SETTINGS, True)
 
-        # Send clear and reset
-        success = self.write("*cls;*rst")
+        if defer_OPC:
+            return self.write("*cls;*rst")
 
-        # Wait for the last operation to finish before timeout expires
-        self.wait_for_OPC()
+        # The reset operation can take a long time to complete. Momentarily
+        # increase the timeout if necessary. Each access of 'device.timeout'
+        # goes through the VISA driver, so leave it alone when it is long
+        # enough already, which is the case for the default 'VISA_TIMEOUT'.
+        timeout = self.device.timeout
+        must_adjust_timeout = timeout < RESET_TIMEOUT
+        if must_adjust_timeout:
+            self.device.timeout = RESET_TIMEOUT
+
+        try:
+            # Send clear and reset
+            success = self.write("*cls;*rst")
 
-        # Restore timeout
-        self.device.timeout = VISA_TIMEOUT
+            # Wait for the last operation to finish before timeout expires
+            self.wait_for_OPC()
+        finally:
+            if must_adjust_timeout:
+                self.device.timeout = timeout
 
         return success
 
@@ -390,54 +972,181 @@ class Keysight_N8700:
         """'Operation complete' query, used for event synchronization.
 
         Will wait for all device operations to complete or until a timeout is
-        triggered. Blocking.
+        triggered. Blocking. Returns immediately when nothing got sent to the
+        device since the last successful wait.
 
         Returns True if successful, False otherwise.
         """
+        if not self._ops_pending:
+            return True
+
         # Returns an ASCII "+1" when all pending overlapped operations have been
         # completed.
         _success, reply = self.query("*opc?")
         if reply == "1":
+            self._ops_pending = False
             return True
 
         print(f"Warning: *opc? timed out at device {self.name}")
         return False
 
-    def wait_for_OPC_indefinitely(self):
-        """Poll OPC status bit for 'operation complete', used for event
-        synchronization.
+    def wait_for_OPC_indefinitely(
+        self, timeout: Union[float, None] = None
+    ) -> bool:
+        """Wait for the OPC status bit to signal 'operation complete', used for
+        event synchronization.
 
-        Will wait indefinitely for all device operations to complete. Blocking.
+        Will wait indefinitely for all device operations to complete, unless a
+        timeout is given. Blocking. Returns immediately when nothing got sent
+        to the device since the last successful wait.
 
         Make sure that the ESR is set to signal bit 0 - OPC (operation complete)
-        before you call this function. This can be done by calling
+        and that a service request (SRQ) gets generated on it before you call
+        this function. This can be done by calling
         'prepare_wait_for_OPC_indefinitely()'.
+
+        The wait is handed to the VISA driver, which blocks until the device
+        asserts the SRQ. When the SRQ does not arrive, which happens on some
+        setups like behind a USB isolator, the status byte will get polled
+        instead. Also on all later calls, until the next 'connect()' or
+        'reopen()', so that only the first wait pays the SRQ time-out.
+
+        Args:
+            timeout (`float` | `None`):
+                Give up waiting after this many seconds. None waits
+                indefinitely.
+
+        Returns: True if the operations completed, False otherwise.
         """
 
         if not self.is_alive or self.device is None:
             print("ERROR: Device is not connected yet or already closed.")
-            return
+            return False
+
+        if not self._ops_pending:
+            return True
+
+        tick = time.perf_counter()
+
+        SRQ = visa_constants.EventType.service_request
+        QUEUE = visa_constants.EventMechanism.queue
+
+        use_SRQ = not self._SRQ_unreliable and self._enable_SRQ_event()
+        if use_SRQ:
+            # Drop stale events of an earlier SRQ
+            try:
+                self.device.discard_events(SRQ, QUEUE)
+            except pyvisa.VisaIOError:
+                pass
 
         # Let the device set the ESR bit 0 - OPC (operation complete) to 1 after
         # all device operations have completed.
         self.write("*opc")
 
+        if use_SRQ:
+            SRQ_timeout = SRQ_TIMEOUT
+            if timeout is not None:
+                SRQ_timeout = min(SRQ_timeout, int(timeout * 1000))
+            try:
+                response = self.device.wait_on_event(
+                    SRQ, SRQ_timeout, capture_timeout=True
+                )
+            except pyvisa.VisaIOError:
+                use_SRQ = False  # Not supported
+            else:
+                use_SRQ = not response.timed_out
+                if use_SRQ:
+                    # Acknowledge the SRQ by a serial poll, as VISA prescribes
+                    self._read_stb()
+
+            if not use_SRQ:
+                # Do not rely on the SRQ anymore for the rest of this session
+                self._SRQ_unreliable = True
+
+        if use_SRQ:
+            # Reset the ESR bit 0 - OPC back to 0.
+            self.query("*esr?")
+            self._ops_pending = False
+            return True
+
         # Poll the OPC status bit for 'operation complete'. This is the 5th
-        # bit.
-        while not (self.device.stb & 0b100000) == 0b100000:
-            time.sleep(0.01)
+        # bit. Start polling fast, so that short operations return quickly,
+        # and back off gradually to 10 ms, so that long operations do not
+        # flood the bus with serial polls.
+        delay = 1e-4  # [s]
+        while True:
+            stb = self._read_stb()
+            if stb is None:
+                # Serial polling keeps failing. Fall back to a blocking query.
+                if not self.wait_for_OPC():
+                    return False
+                break
+            if (stb & 0b100000) == 0b100000:
+                break
+            if timeout is not None and time.perf_counter() - tick > timeout:
+                print(f"Warning: OPC timed out at device {self.name}")
+                return False
+
+            time.sleep(delay)
+            delay = min(delay * 1.5, 0.01)
 
         # Reset the ESR bit 0 - OPC back to 0.
         self.query("*esr?")
+        self._ops_pending = False
+        return True
+
+    def _read_stb(self, attempts: int = 3) -> Union[int, None]:
+        """Read the status byte of the device by a serial poll. Reading '.stb'
+        fails intermittently, perhaps due to the USB isolator, so we retry a
+        few times before giving up.
+
+        Returns: The status byte if successful, None otherwise.
+        """
+        if self.device is None:
+            return None
+
+        for _ in range(attempts):
+            try:
+                return self.device.stb
+            except pyvisa.VisaIOError:
+                time.sleep(0.001)
+
+        print(f"Warning: Failed to read the status byte of {self.name}")
+        return None
 
     def prepare_wait_for_OPC_indefinitely(self) -> bool:
-        """Set the ESR to signal bit 0 - OPC (operation complete). Should be
+        """Set the ESR to signal bit 0 - OPC (operation complete) and have the
+        resulting ESB status bit generate a service request (SRQ). Should be
         called only once after a '*rst' in case you want to make use of
         'wait_for_OPC_indefinitely()'.
 
+        Also enables the queueing of SRQ events on the VISA session, which stays
+        enabled until the session gets closed.
+
         Returns: True if the message was sent successfully, False otherwise.
         """
-        return self.write("*ese 1")
+        success = self.write("*ese 1;*sre 32")
+        self._enable_SRQ_event()
+        return success
+
+    def _enable_SRQ_event(self) -> bool:
+        """Enable the queueing of service request (SRQ) events on the VISA
+        session, once per session.
+
+        Returns: True if enabled, False if not supported.
+        """
+        if not self._SRQ_enabled and self.device is not None:
+            try:
+                self.device.enable_event(
+                    visa_constants.EventType.service_request,
+                    visa_constants.EventMechanism.queue,
+                )
+            except pyvisa.VisaIOError:
+                pass
+            else:
+                self._SRQ_enabled = True
+
+        return self._SRQ_enabled
 
     def query_error(self, verbose: bool = False) -> bool:
         """Pop one error string from the error queue of the device and store it
@@ -447,14 +1156,18 @@ class Keysight_N8700:
         """
         success, reply = self.query("err?")
         if isinstance(reply, str):
-            if reply.find(STR_NO_ERROR) == 0:
-                self.state.error = None
-            else:
-                self.state.error = reply.strip("ERR").strip()
-                if verbose:  # DEBUG INFO
-                    print(f"  {self.state.error}")
+            self._parse_error(reply, verbose)
         return success
 
+    def _parse_error(self, reply: str, verbose: bool = False):
+        if reply.startswith(STR_NO_ERROR):
+            self.state.error = None
+        else:
+            match = RE_ERROR.match(reply)
+            self.state.error = match.group(1) if match else reply
+            if verbose:  # DEBUG INFO
+                print(f"  {self.state.error}")
+
     def query_all_errors_in_queue(self, verbose: bool = False):
         """Check if there are errors in the device queue and retrieve all if
         any and append these to 'state.all_errors'.
@@ -465,19 +1178,32 @@ class Keysight_N8700:
 
         # if (self.device.stb & 0b100) == 0b100:
         # There are unread errors in the queue available. Retrieve all.
-        while True:
-            if self.query_error():
-                if self.state.error is None:
-                    break
-
-                self.state.all_errors.append(self.state.error)
-            else:
-                break
+        self._drain_errors_batch()
 
         if verbose:  # DEBUG INFO
             for error in self.state.all_errors:
                 print(f"  {error}")
 
+    def _drain_errors_batch(self, batch: int = ERROR_BATCH_SIZE):
+        """Pop errors from the error queue of the device, up to 'batch' errors
+        per compound query, until no error is left. Append these to
+        'state.all_errors'.
+        """
+        msg_str = ";:".join(["err?"] * batch)
+        while True:
+            _success, reply = self.query(msg_str)
+            if not isinstance(reply, str):
+                return
+
+            # Split on the separators that precede the next error reply only,
+            # in case an error description itself contains a semicolon
+            for error_reply in RE_ERROR_SEPARATOR.split(reply):
+                self._parse_error(error_reply.strip())
+                if self.state.error is None:
+                    return
+
+                self.state.all_errors.append(self.state.error)
+
     def query_status_QC(self, verbose: bool = False) -> bool:
         """Read out the questionable condition status registers of the device
         and store them in the 'State'-class members.
@@ -486,23 +1212,7 @@ class Keysight_N8700:
         """
         success, reply = self.query("stat:ques:cond?")
         if isinstance(reply, str):
-            # fmt: off
-            status_code = int(reply)
-            self.state.status_QC_OV  = bool(status_code & 1)
-            self.state.status_QC_OC  = bool(status_code & 2)
-            self.state.status_QC_PF  = bool(status_code & 4)
-            self.state.status_QC_OT  = bool(status_code & 16)
-            self.state.status_QC_INH = bool(status_code & 512)
-            self.state.status_QC_UNR = bool(status_code & 1024)
-
-            if verbose:  # DEBUG INFO
-                if self.state.status_QC_OV:  print("  OV")
-                if self.state.status_QC_OC:  print("  OC")
-                if self.state.status_QC_PF:  print("  PF")
-                if self.state.status_QC_OT:  print("  OT")
-                if self.state.status_QC_INH: print("  INH")
-                if self.state.status_QC_UNR: print("  UNH")
-            # fmt: on
+            self._parse_status_QC(int(reply), verbose)
 
         return success
 
@@ -514,20 +1224,136 @@ class Keysight_N8700:
         """
         success, reply = self.query("stat:oper:cond?")
         if isinstance(reply, str):
-            # fmt: off
-            status_code = int(reply)
-            self.state.status_OC_WTG = bool(status_code & 32)
-            self.state.status_OC_CV  = bool(status_code & 256)
-            self.state.status_OC_CC  = bool(status_code & 1024)
-
-            if verbose:  # DEBUG INFO
-                if self.state.status_OC_WTG: print("  WTG")
-                if self.state.status_OC_CV : print("  CV")
-                if self.state.status_OC_CC : print("  CC")
-            # fmt: on
+            self._parse_status_OC(int(reply), verbose)
 
         return success
 
+    def query_status_all(self) -> bool:
+        """Read out both the questionable and the operation condition status
+        registers of the device in one compound SCPI query and store them in
+        the 'State'-class members.
+
+        Returns: True if the query was received successfully, False otherwise.
+        """
+        replies = self._query_compound("stat:ques:cond?", "stat:oper:cond?")
+        if replies is None:
+            return False
+
+        try:
+            QC, OC = map(int, replies)
+        except ValueError:
+            print(f"ERROR: Unexpected reply from {self.name}: {replies}")
+            return False
+
+        self._parse_status_QC(QC)
+        self._parse_status_OC(OC)
+
+        return True
+
+    def _parse_status_QC(self, status_code: int, verbose: bool = False):
+        self.state.status_QC = status_code
+        for name, mask, _label in STATUS_QC_BITS:
+            setattr(self.state, name, bool(status_code & mask))
+
+        if verbose:  # DEBUG INFO
+            self._print_status_QC()
+
+    def _parse_status_OC(self, status_code: int, verbose: bool = False):
+        self.state.status_OC = status_code
+        for name, mask, _label in STATUS_OC_BITS:
+            setattr(self.state, name, bool(status_code & mask))
+
+        if verbose:  # DEBUG INFO
+            self._print_status_OC()
+
+    def _print_status_QC(self):
+        for name, _mask, label in STATUS_QC_BITS:
+            if getattr(self.state, name):
+                print(f"  {label}")
+
+    def _print_status_OC(self):
+        for name, _mask, label in STATUS_OC_BITS:
+            if getattr(self.state, name):
+                print(f"  {label}")
+
+    def query_settings_and_status(self) -> bool:
+        """Read out the OVP level, the sourced voltage and current, the OCP
+        state and the questionable and operation condition status registers
+        of the device in one compound SCPI query, and store them in the
+        'State'-class members.
+
+        The same query also pops one error string from the error queue, just
+        like 'query_error()' does. This saves a separate round-trip to find
+        out whether the error queue is empty, which it normally is.
+
+        Returns: True if the query was received successfully, False otherwise.
+        """
+        replies = self._query_compound(*QUERIES_SETTINGS_AND_STATUS)
+        if replies is None:
+            return False
+
+        return self._parse_settings_and_status(replies)
+
+    def _parse_settings_and_status(self, replies: List[str]) -> bool:
+        """Parse the replies to 'QUERIES_SETTINGS_AND_STATUS'.
+
+        Returns: True if the replies made sense, False otherwise.
+        """
+        OVP_level, V_source, I_source, ENA_OCP, QC, OC, error = replies
+        try:
+            self.state.OVP_level = float(OVP_level)
+            self.state.V_source = float(V_source)
+            self.state.I_source = float(I_source)
+            self.state.ENA_OCP = bool(int(ENA_OCP))
+            self._parse_status_QC(int(QC))
+            self._parse_status_OC(int(OC))
+        except ValueError:
+            print(f"ERROR: Unexpected reply from {self.name}: {replies}")
+            return False
+
+        self._dirty = dict.fromkeys(CACHED_SETTINGS, False)
+        self._parse_error(error.strip())
+
+        return True
+
+    def query_meas_and_status(self) -> bool:
+        """Measure the output voltage and current, and read out the output
+        state, the OCP state and the questionable and operation condition
+        status registers of the device in one compound SCPI query. Store them
+        in the 'State'-class members and derive the output power.
+
+        The same query also pops one error string from the error queue, just
+        like 'query_error()' does. This saves a separate round-trip to find
+        out whether the error queue is empty, which it normally is.
+
+        Returns: True if the query was received successfully, False otherwise.
+        """
+        replies = self._query_compound(*QUERIES_MEAS_AND_STATUS)
+        if replies is None:
+            return False
+
+        V_meas, I_meas, ENA_output, ENA_OCP, QC, OC, error = replies
+        try:
+            V_meas = float(V_meas)
+            I_meas = float(I_meas)
+            ENA_output = bool(int(ENA_output))
+            ENA_OCP = bool(int(ENA_OCP))
+            QC = int(QC)
+            OC = int(OC)
+        except ValueError:
+            print(f"ERROR: Unexpected reply from {self.name}: {replies}")
+            return False
+
+        self.state.set_VI_meas(V_meas, I_meas)
+        self.state.ENA_output = ENA_output
+        self.state.ENA_OCP = ENA_OCP
+        self._dirty["ENA_OCP"] = False
+        self._parse_status_QC(QC)
+        self._parse_status_OC(OC)
+        self._parse_error(error.strip())
+
+        return True
+
     # --------------------------------------------------------------------------
     #   set_PON_off
     # --------------------------------------------------------------------------
@@ -571,27 +1397,32 @@ class Keysight_N8700:
         Returns: True if the message was sent successfully, False otherwise.
         """
         if flag:
-            success = self.write("sour:curr:prot:stat on")
-            if success:
-                self.state.ENA_OCP = True
+            success = self.write("curr:prot:stat on")
         else:
-            success = self.write("sour:curr:prot:stat off")
-            if success:
-                self.state.ENA_OCP = False
+            success = self.write("curr:prot:stat off")
+        if success:
+            self.state.ENA_OCP = flag
+            self._dirty["ENA_OCP"] = False
         return success
 
-    def query_ENA_OCP(self, verbose: bool = False) -> bool:
-        """
+    def query_ENA_OCP(
+        self, verbose: bool = False, force: bool = False
+    ) -> bool:
+        """Reuses the last known value, unless it might have changed since or
+        when `force` is True.
+
         Returns: True if the query was received successfully, False otherwise.
         """
-        _success, reply = self.query("sour:curr:prot:stat?")
-        if isinstance(reply, str):
+        if force or self._dirty["ENA_OCP"]:
+            _success, reply = self.query("curr:prot:stat?")
+            if not isinstance(reply, str):
+                return False
             self.state.ENA_OCP = bool(int(reply))
-            if verbose:  # DEBUG INFO
-                print(self.state.ENA_OCP)
-            return True
+            self._dirty["ENA_OCP"] = False
 
-        return False
+        if verbose:  # DEBUG INFO
+            print(self.state.ENA_OCP)
+        return True
 
     """These commands set the over-voltage protection (OVP) level of the
     output. The values are programmed in volts. If the output voltage exceeds
@@ -613,20 +1444,27 @@ class Keysight_N8700:
         Returns: True if the message was sent successfully, False otherwise.
         """
         self.state.OVP_level = voltage_V
-        return self.write(f"sour:volt:prot:lev {voltage_V:.5f}")
+        self._dirty["OVP_level"] = True
+        return self.write_raw(CMD_SOUR_VOLT_PROT_LEV % voltage_V)
+
+    def query_OVP_level(
+        self, verbose: bool = False, force: bool = False
+    ) -> bool:
+        """Reuses the last known value, unless it might have changed since or
+        when `force` is True.
 
-    def query_OVP_level(self, verbose: bool = False) -> bool:
-        """
         Returns: True if the query was received successfully, False otherwise.
         """
-        _success, reply = self.query("sour:volt:prot:lev?")
-        if isinstance(reply, str):
+        if force or self._dirty["OVP_level"]:
+            _success, reply = self.query("volt:prot?")
+            if not isinstance(reply, str):
+                return False
             self.state.OVP_level = float(reply)
-            if verbose:  # DEBUG INFO
-                print(self.state.OVP_level)
-            return True
+            self._dirty["OVP_level"] = False
 
-        return False
+        if verbose:  # DEBUG INFO
+            print(self.state.OVP_level)
+        return True
 
     # --------------------------------------------------------------------------
     #   Output related
@@ -643,6 +1481,85 @@ class Keysight_N8700:
             self.state.ENA_output = True
         return success
 
+    def apply_state(
+        self,
+        V_source: Union[float, None] = None,
+        I_source: Union[float, None] = None,
+        OVP_level: Union[float, None] = None,
+        ENA_OCP: Union[bool, None] = None,
+        ENA_output: Union[bool, None] = None,
+    ) -> bool:
+        """Apply multiple settings at once. Only the settings that differ from
+        the current 'State' will be sent, combined into one SCPI message.
+
+        A cached setting whose value in 'State' might not match the device,
+        e.g. because the device rejected or clamped it, gets read back first.
+
+        Args:
+            V_source, I_source, OVP_level, ENA_OCP, ENA_output:
+                New value of the setting. None leaves the setting unchanged.
+
+        Returns: True if the message was sent successfully or when there was
+            nothing to send, False otherwise.
+        """
+        # Read back the cached settings that might be out of date. Only goes to
+        # the device for a setting that is dirty.
+        # fmt: off
+        if V_source  is not None: self.query_V_source()
+        if I_source  is not None: self.query_I_source()
+        if OVP_level is not None: self.query_OVP_level()
+        if ENA_OCP   is not None: self.query_ENA_OCP()
+        # fmt: on
+
+        def differs(key: str, value) -> bool:
+            # Still dirty when the read back failed: Send to be sure
+            return self._dirty[key] or value != getattr(self.state, key)
+
+        commands: List[bytes] = []
+
+        # The OVP level must stay above the source voltage times 1.05. Hence,
+        # raise the OVP level before the voltage, but lower it after.
+        cmd_OVP_level = b""
+        lower_OVP_level = False
+        if OVP_level is not None and differs("OVP_level", OVP_level):
+            cmd_OVP_level = CMD_SOUR_VOLT_PROT_LEV % OVP_level
+            lower_OVP_level = OVP_level < self.state.OVP_level
+
+        if cmd_OVP_level and not lower_OVP_level:
+            commands.append(cmd_OVP_level)
+        if V_source is not None and differs("V_source", V_source):
+            commands.append(CMD_SOUR_VOLT % V_source)
+        if cmd_OVP_level and lower_OVP_level:
+            commands.append(cmd_OVP_level)
+
+        if I_source is not None and differs("I_source", I_source):
+            commands.append(CMD_SOUR_CURR % I_source)
+        if ENA_OCP is not None and differs("ENA_OCP", ENA_OCP):
+            commands.append(
+                b"curr:prot:stat " + (b"on" if ENA_OCP else b"off")
+            )
+        if ENA_output is not None and ENA_output != self.state.ENA_output:
+            commands.append(b"outp on" if ENA_output else b"outp off")
+
+        if not commands:
+            return True
+
+        # Parametric messages are hardly ever the same twice. Send them
+        # pre-encoded, so they do not crowd out the cache of 'write()'.
+        success = self.write_raw(b";:".join(commands))
+        if success:
+            # fmt: off
+            if V_source   is not None: self.state.V_source   = V_source
+            if I_source   is not None: self.state.I_source   = I_source
+            if OVP_level  is not None: self.state.OVP_level  = OVP_level
+            if ENA_OCP    is not None: self.state.ENA_OCP    = ENA_OCP
+            if ENA_output is not None: self.state.ENA_output = ENA_output
+            if V_source   is not None: self._dirty["V_source"]  = True
+            if I_source   is not None: self._dirty["I_source"]  = True
+            if OVP_level  is not None: self._dirty["OVP_level"] = True
+            # fmt: on
+        return success
+
     def turn_on(self) -> bool:
         """
         Returns: True if the message was sent successfully, False otherwise.
@@ -687,49 +1604,80 @@ class Keysight_N8700:
         Returns: True if the message was sent successfully, False otherwise.
         """
         self.state.I_source = current_A
-        return self.write(f"sour:curr {current_A:.5f}")
+        self._dirty["I_source"] = True
+        return self.write_raw(CMD_SOUR_CURR % current_A)
 
     def set_V_source(self, voltage_V: float) -> bool:
         """
         Returns: True if the message was sent successfully, False otherwise.
         """
         self.state.V_source = voltage_V
-        return self.write(f"sour:volt {voltage_V:.5f}")
+        self._dirty["V_source"] = True
+        return self.write_raw(CMD_SOUR_VOLT % voltage_V)
+
+    def query_I_source(
+        self, verbose: bool = False, force: bool = False
+    ) -> bool:
+        """Reuses the last known value, unless it might have changed since or
+        when `force` is True.
 
-    def query_I_source(self, verbose: bool = False) -> bool:
-        """
         Returns: True if the query was received successfully, False otherwise.
         """
-        _success, reply = self.query("sour:curr?")
-        if isinstance(reply, str):
+        if force or self._dirty["I_source"]:
+            _success, reply = self.query("curr?")
+            if not isinstance(reply, str):
+                return False
             self.state.I_source = float(reply)
-            if verbose:  # DEBUG INFO
-                print(self.state.I_source)
-            return True
+            self._dirty["I_source"] = False
 
-        return False
+        if verbose:  # DEBUG INFO
+            print(self.state.I_source)
+        return True
+
+    def query_V_source(
+        self, verbose: bool = False, force: bool = False
+    ) -> bool:
+        """Reuses the last known value, unless it might have changed since or
+        when `force` is True.
 
-    def query_V_source(self, verbose: bool = False) -> bool:
-        """
         Returns: True if the query was received successfully, False otherwise.
         """
-        _success, reply = self.query("sour:volt?")
-        if isinstance(reply, str):
+        if force or self._dirty["V_source"]:
+            _success, reply = self.query("volt?")
+            if not isinstance(reply, str):
+                return False
             self.state.V_source = float(reply)
-            if verbose:  # DEBUG INFO
-                print(self.state.V_source)
-            return True
+            self._dirty["V_source"] = False
 
-        return False
+        if verbose:  # DEBUG INFO
+            print(self.state.V_source)
+        return True
 
-    def query_I_meas(self, verbose: bool = False) -> bool:
+    def query_VI_meas(self) -> bool:
+        """Measure both the output voltage and current in one compound SCPI
+        query and derive the output power from the two.
+
+        Returns: True if the query was received successfully, False otherwise.
         """
+        replies = self._query_compound("meas:volt?", "meas:curr?")
+        if replies is None:
+            return False
+
+        try:
+            V_meas, I_meas = map(float, replies)
+        except ValueError:
+            print(f"ERROR: Unexpected reply from {self.name}: {replies}")
+            return False
+
+        self.state.set_VI_meas(V_meas, I_meas)
+        return True
+
+    def query_I_meas(self, verbose: bool = False) -> bool:
+        """Deprecated: Use 'query_VI_meas()' instead, which this calls.
+
         Returns: True if the query was received successfully, False otherwise.
         """
-        _success, reply = self.query("meas:curr?")
-        if isinstance(reply, str):
-            self.state.I_meas = float(reply)
-            self.state.P_meas = self.state.I_meas * self.state.V_meas
+        if self.query_VI_meas():
             if verbose:  # DEBUG INFO
                 print(self.state.I_meas)
             return True
@@ -737,13 +1685,11 @@ class Keysight_N8700:
         return False
 
     def query_V_meas(self, verbose: bool = False) -> bool:
-        """
+        """Deprecated: Use 'query_VI_meas()' instead, which this calls.
+
         Returns: True if the query was received successfully, False otherwise.
         """
-        _success, reply = self.query("meas:volt?")
-        if isinstance(reply, str):
-            self.state.V_meas = float(reply)
-            self.state.P_meas = self.state.I_meas * self.state.V_meas
+        if self.query_VI_meas():
             if verbose:  # DEBUG INFO
                 print(self.state.V_meas)
             return True
@@ -779,10 +1725,11 @@ class Keysight_N8700:
         self.set_ENA_output(False)  # Disable output for safety
         self.wait_for_OPC()
 
+        set_V_source = self.set_V_source
         tic = time.perf_counter()
 
         for i in range(100):
-            self.set_V_source(i)
+            set_V_source(i)
 
         self.wait_for_OPC_indefinitely()
 
@@ -794,35 +1741,54 @@ class Keysight_N8700:
     # --------------------------------------------------------------------------
 
     def report(self):
-        """Report to terminal."""
-        print("\nQuestionable condition")
-        print(chr(0x2015) * 26)
-        self.query_status_QC(True)
-
-        print("\nOperation condition")
-        print(chr(0x2014) * 26)
-        self.query_status_OC(True)
-
-        print("\nError")
-        print(chr(0x2014) * 26)
-        self.query_error(True)
-        while not self.state.error is None:
-            self.query_error(True)
-
-        print("\nProtection")
-        print(chr(0x2014) * 26)
-        # fmt: off
-        print("  ENA_output?  : ", end=''); self.query_ENA_output(True)
-        print("  ENA_OCP?     : ", end=''); self.query_ENA_OCP(True)
-        print("  OVP level [V]: ", end=''); self.query_OVP_level(True)
-        print("  V_source  [V]: ", end=''); self.query_V_source(True)
-        print("  I_source  [A]: ", end=''); self.query_I_source(True)
-
-        print("\nMeasure")
-        print(chr(0x2014)*26)
-        print("  V_meas    [V]: ", end=''); self.query_V_meas(True)
-        print("  I_meas    [A]: ", end=''); self.query_I_meas(True)
-        # fmt: on
+        """Report to terminal. All values are read out in one compound SCPI
+        query, except for the errors beyond the first one, if any.
+        """
+        replies = self._query_compound(
+            "outp?", "meas:volt?", "meas:curr?", *QUERIES_SETTINGS_AND_STATUS
+        )
+        if replies is None or not self._parse_settings_and_status(replies[3:]):
+            return
+
+        try:
+            ENA_output = bool(int(replies[0]))
+            V_meas, I_meas = map(float, replies[1:3])
+        except ValueError:
+            print(f"ERROR: Unexpected reply from {self.name}: {replies}")
+            return
+
+        self.state.ENA_output = ENA_output
+        self.state.set_VI_meas(V_meas, I_meas)
+
+        # Retrieve the errors left in the queue, if any
+        N_old_errors = len(self.state.all_errors)
+        if self.state.error is not None:
+            self.state.all_errors.append(self.state.error)
+            self._drain_errors_batch()
+
+        state = self.state
+        lines = ["", "Questionable condition", STR_SEP_1]
+        lines += [f"  {x[2]}" for x in STATUS_QC_BITS if getattr(state, x[0])]
+        lines += ["", "Operation condition", STR_SEP_2]
+        lines += [f"  {x[2]}" for x in STATUS_OC_BITS if getattr(state, x[0])]
+        lines += ["", "Error", STR_SEP_2]
+        lines += [f"  {x}" for x in state.all_errors[N_old_errors:]]
+        lines += [
+            "",
+            "Protection",
+            STR_SEP_2,
+            f"  ENA_output?  : {state.ENA_output}",
+            f"  ENA_OCP?     : {state.ENA_OCP}",
+            f"  OVP level [V]: {state.OVP_level}",
+            f"  V_source  [V]: {state.V_source}",
+            f"  I_source  [A]: {state.I_source}",
+            "",
+            "Measure",
+            STR_SEP_2,
+            f"  V_meas    [V]: {state.V_meas}",
+            f"  I_meas    [A]: {state.I_meas}",
+        ]
+        print("\n".join(lines))
 
     # --------------------------------------------------------------------------
     #   read_config_file
@@ -836,33 +1802,45 @@ class Keysight_N8700:
              OVP_level      # Over-voltage protection level [V]
              ENA_OCP        # Is over-current protection enabled?
 
-        Do not panic if the file does not exist or cannot be read.
+        The file is not parsed again when it has not changed since the last
+        successful read. Do not panic if the file does not exist or cannot be
+        read.
 
         Returns: True if successful, False otherwise.
         """
-        if isinstance(self.path_config, Path):
-            if self.path_config.is_file():
-                try:
-                    with self.path_config.open(encoding="utf-8") as f:
-                        self.config.V_source = float(f.readline().strip())
-                        self.config.I_source = float(f.readline().strip())
-                        self.config.P_source = float(f.readline().strip())
-                        self.config.OVP_level = float(f.readline().strip())
-                        self.config.ENA_OCP = (
-                            f.readline().strip().lower() == "true"
-                        )
-
-                    return True
-                except Exception:
-                    pass  # Do not panic and remain silent
-
-        return False
+        try:
+            stat = self.path_config.stat()
+            key = (self.path_config, stat.st_mtime_ns, stat.st_size)
+            if self._config_cache is not None and self._config_cache[0] == key:
+                values = self._config_cache[1]
+            else:
+                text = self.path_config.read_text(encoding="utf-8")
+                lines = text.splitlines()
+                values = (
+                    float(lines[0]),
+                    float(lines[1]),
+                    float(lines[2]),
+                    float(lines[3]),
+                    lines[4].strip().lower() == "true",
+                )
+                self._config_cache = (key, values)
+        except Exception:
+            return False  # Do not panic and remain silent
+
+        (
+            self.config.V_source,
+            self.config.I_source,
+            self.config.P_source,
+            self.config.OVP_level,
+            self.config.ENA_OCP,
+        ) = values
+        return True
 
     # --------------------------------------------------------------------------
     #   write_config_file
     # --------------------------------------------------------------------------
 
-    def write_config_file(self) -> bool:
+    def write_config_file(self, defer: bool = False) -> bool:
         """Try to write the config textfile containing:
              V_source       # Voltage to be sourced [V]
              I_source       # Current to be sourced [A]
@@ -870,31 +1848,107 @@ class Keysight_N8700:
              OVP_level      # Over-voltage protection level [V]
              ENA_OCP        # Is over-current protection enabled?
 
-        Do not panic if the file does not exist or cannot be read.
+        Do not panic if the file cannot be written.
 
-        Returns: True if successful, False otherwise.
+        Args:
+            defer (`bool`, optional):
+                When True, the write is skipped if the config file was written
+                less than `CONFIG_FLUSH_INTERVAL` seconds ago. The change will
+                then be written by the next call that is not skipped, or by
+                `flush_config()`. Useful to coalesce bursts of state changes
+                into a single write. A deferred write is also skipped when the
+                contents have not changed since the last successful write.
+
+                Default: False
+
+        Returns: True if successful or deferred, False otherwise.
+        """
+        if defer:
+            self._config_dirty = True
+            if (
+                time.perf_counter() - self._config_last_flush
+                < CONFIG_FLUSH_INTERVAL
+            ):
+                return True
+
+        return self._flush_config_file(skip_unchanged=defer)
+
+    def flush_config(self, force: bool = False) -> bool:
+        """Write out a config change that got deferred by
+        `write_config_file(defer=True)`, regardless of `CONFIG_FLUSH_INTERVAL`.
+
+        Args:
+            force (`bool`, optional):
+                When True, write the config file even if no change is pending
+                or its contents have not changed since the last write.
+
+                Default: False
+
+        Returns: True if successful or nothing is pending, False otherwise.
+        """
+        if not (self._config_dirty or force):
+            return True
+
+        return self._flush_config_file(skip_unchanged=not force)
+
+    def _flush_config_file(self, skip_unchanged: bool) -> bool:
+        """Write the config file.
+
+        Args:
+            skip_unchanged (`bool`):
+                When True, skip the write when the contents are the same as
+                those of the last successful write by this instance. NOTE: The
+                file on disk might have been changed or deleted since, by
+                others. Hence, an explicit save must not skip.
         """
-        if isinstance(self.path_config, Path):
-            if not self.path_config.parent.is_dir():
-                # Subfolder does not exists yet. Create.
-                try:
-                    self.path_config.parent.mkdir()
-                except Exception:
-                    pass  # Do not panic and remain silent
+        self._config_dirty = False
+        self._config_last_flush = time.perf_counter()
+
+        state = self.state
+        payload = CONFIG_FORMAT(
+            state.V_source,
+            state.I_source,
+            state.P_source,
+            state.OVP_level,
+            state.ENA_OCP,
+        ).encode("ascii")
+
+        if skip_unchanged and self._last_config_blob == (
+            self.path_config,
+            payload,
+        ):
+            # Config file is already up to date
+            return True
 
+        # The modification time might not change, given its resolution
+        self._config_cache = None
+        try:
             try:
-                # Write the config file
-                self.path_config.write_text(
-                    f"{self.state.V_source:.2f}\n"
-                    f"{self.state.I_source:.3f}\n"
-                    f"{self.state.P_source:.2f}\n"
-                    f"{self.state.OVP_level:.2f}\n"
-                    f"{self.state.ENA_OCP}",
-                    encoding="utf-8",
-                )
-            except Exception:
-                pass  # Do not panic and remain silent
-            else:
-                return True
+                self._write_bytes_atomic(self.path_config, payload)
+            except FileNotFoundError:
+                # Subfolder does not exist yet. Create and try again.
+                self.path_config.parent.mkdir(parents=True, exist_ok=True)
+                self._write_bytes_atomic(self.path_config, payload)
+        except Exception:
+            # Keep the change pending, so that a next flush tries again
+            self._config_dirty = True
+            self._last_config_blob = None
+            return False  # Do not panic and remain silent
+
+        self._last_config_blob = (self.path_config, payload)
+        return True
 
-        return False
+    @staticmethod
+    def _write_bytes_atomic(path: Path, payload: bytes):
+        """Write `payload` to a temporary sibling file first and only then move
+        it into place, so that a crash can never leave a half-written file
+        behind. The payload is tiny, so skip the buffered text layer of
+        `Path.write_text()` and write it in one go.
+        """
+        path_tmp = path.with_name(path.name + ".tmp")
+        fd = os.open(path_tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            os.write(fd, payload)
+        finally:
+            os.close(fd)
+        os.replace(path_tmp, path)
@@ -16,27 +16,85 @@ __date__ = "23-05-2024"
 __version__ = "1.5.0"
 # pylint: disable=missing-function-docstring, multiple-statements, broad-except
 
+import math
 import time
+from enum import IntEnum
+from typing import Callable, List, Tuple, Union
 
 from qtpy import QtCore, QtGui, QtWidgets as QtWid
 from qtpy.QtCore import Signal, Slot  # type: ignore
-import numpy as np
 
 import dvg_pyqt_controls as controls
 from dvg_debug_functions import dprint, print_fancy_traceback as pft
 from dvg_pid_controller import PID_Controller
 
 from dvg_qdeviceio import QDeviceIO, DAQ_TRIGGER
-from dvg_devices.Keysight_N8700_protocol_SCPI import Keysight_N8700
+from dvg_devices.Keysight_N8700_protocol_SCPI import (
+    Keysight_N8700,
+    STATUS_QC_BITS,
+    STATUS_OC_BITS,
+)
 
 # Monospace font
 FONT_MONOSPACE = QtGui.QFont("Monospace", 12, weight=QtGui.QFont.Weight.Bold)
 FONT_MONOSPACE.setStyleHint(QtGui.QFont.StyleHint.TypeWriter)
 
+# The GUI gets updated at most once per this interval, no matter how fast the
+# DAQ is running. Faster than this is of no use to the human eye.
+GUI_UPDATE_INTERVAL_MS = 50  # 50 [ms]
 
-# Enumeration
-class GUI_input_fields:
-    [ALL, OVP_level, V_source, I_source, P_source] = range(5)
+
+def set_text_if_changed(line_edit: QtWid.QLineEdit, text: str):
+    """Unlike 'QLabel' and 'QAbstractButton', a 'QLineEdit' does not skip
+    'setText()' when the text is unchanged. It would reset the cursor and
+    repaint, on every GUI update.
+    """
+    if line_edit.text() != text:
+        line_edit.setText(text)
+
+
+def set_number_validator(line_edit: QtWid.QLineEdit, decimals: int = 3):
+    """Only allow non-negative numbers to be entered into 'line_edit', so that
+    a typo gets rejected by the widget itself instead of reaching 'float()'.
+    The C locale makes sure the decimal separator is always a '.', just like
+    'float()' expects, regardless of the system locale.
+    """
+    validator = QtGui.QDoubleValidator(0, 1e6, decimals, line_edit)
+    validator.setNotation(QtGui.QDoubleValidator.Notation.StandardNotation)
+    validator.setLocale(QtCore.QLocale.c())
+    line_edit.setValidator(validator)
+
+
+def read_number(line_edit: QtWid.QLineEdit) -> float:
+    """Returns the number entered in 'line_edit', or 0 when it is not a
+    number.
+    """
+    try:
+        return float(line_edit.text())
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def create_question_box(title: str, msg: str) -> QtWid.QMessageBox:
+    """Returns a Yes/No message box with 'No' as the default button."""
+    msgbox = QtWid.QMessageBox()
+    msgbox.setIcon(QtWid.QMessageBox.Icon.Question)
+    msgbox.setWindowTitle(title)
+    msgbox.setText(msg)
+    msgbox.setStandardButtons(
+        QtWid.QMessageBox.StandardButton.Yes
+        | QtWid.QMessageBox.StandardButton.No
+    )
+    msgbox.setDefaultButton(QtWid.QMessageBox.StandardButton.No)
+    return msgbox
+
+
+class GUI_input_fields(IntEnum):
+    ALL = 0
+    OVP_level = 1
+    V_source = 2
+    I_source = 3
+    P_source = 4
 
 
 class Keysight_N8700_qdev(QDeviceIO):
@@ -87,6 +145,23 @@ class Keysight_N8700_qdev(QDeviceIO):
         # Keysight_N8700`.
         self.dev.PID_power = PID_Controller(Kp=0.5, Ki=2, Kd=0)
 
+        # Power setpoint that the PID setpoint was last derived from
+        self._PID_P_source: Union[float, None] = None
+
+        # Clear the device buffers at the start of the next DAQ tick?
+        self._clear_device = True
+
+        # OVP level that the PID output limits were last derived from
+        self._PID_OVP_level: Union[float, None] = None
+
+        # Raw status register codes as last shown in the GUI. The LEDs get
+        # created unchecked, i.e. showing all bits cleared.
+        self._shown_status: Tuple[int, int] = (0, 0)
+
+        # Error list and its length as last shown in the GUI. 'all_errors' only
+        # ever gets appended to, or replaced by a new list when cleared.
+        self._shown_errors: Tuple[Union[List[str], None], int] = (None, 0)
+
         self.create_worker_DAQ(
             DAQ_trigger=DAQ_trigger,
             DAQ_function=self.DAQ_function,
@@ -98,8 +173,15 @@ class Keysight_N8700_qdev(QDeviceIO):
 
         self.create_worker_jobs(jobs_function=self.jobs_function, debug=debug)
 
+        # Throttling of the GUI updates, see '_throttle_update_GUI()'
+        self._timer_GUI = QtCore.QTimer(self)
+        self._timer_GUI.setSingleShot(True)
+        self._timer_GUI.setInterval(GUI_UPDATE_INTERVAL_MS)
+        self._timer_GUI.timeout.connect(self._update_GUI_if_pending)
+        self._GUI_update_pending = False
+
         self.create_GUI()
-        self.signal_DAQ_updated.connect(self.update_GUI)
+        self.signal_DAQ_updated.connect(self._throttle_update_GUI)
         self.signal_GUI_input_field_update.connect(self.update_GUI_input_field)
 
         # Update GUI immediately, instead of waiting for the first refresh
@@ -112,22 +194,29 @@ class Keysight_N8700_qdev(QDeviceIO):
 
     def DAQ_function(self) -> bool:
         DEBUG_local = False
+        dev = self.dev
+        state = dev.state
+        PID = dev.PID_power
         if DEBUG_local:
             tick = time.perf_counter()
 
         # Clear input and output buffers of the device. Seems to resolve
-        # intermittent communication time-outs.
-        if self.dev.device is not None:
-            self.dev.device.clear()
+        # intermittent communication time-outs. Only needed to recover from a
+        # previous tick that failed, e.g. on such a time-out.
+        if self._clear_device and dev.device is not None:
+            dev.device.clear()
             time.sleep(0.01)
 
-        # Finish all operations at the device first
-        if not self.dev.wait_for_OPC():
-            return False
+        # Assume failure until this tick has run to completion
+        self._clear_device = True
 
-        if not self.dev.query_V_meas():
+        # Finish all operations at the device first, e.g. a new voltage set by
+        # the PID controller during the previous tick
+        if not dev.wait_for_OPC():
             return False
-        if not self.dev.query_I_meas():
+
+        # Read out all measurements and status in one go
+        if not dev.query_meas_and_status():
             return False
 
         # --------------------
@@ -147,60 +236,61 @@ class Keysight_N8700_qdev(QDeviceIO):
         # resistance is a function of the heater temperature, but the dependence
         # is expected to be insignificant in our small temperature range of 20
         # to 100 deg C), we now have linearized the PID feedback relation.
-        self.dev.PID_power.set_mode(
-            (self.dev.state.ENA_output and self.dev.state.ENA_PID),
-            self.dev.state.P_meas,
-            self.dev.state.V_source,
+        PID.set_mode(
+            (state.ENA_output and state.ENA_PID),
+            state.P_meas,
+            state.V_source,
         )
 
-        self.dev.PID_power.setpoint = np.sqrt(self.dev.state.P_source)
-        if self.dev.PID_power.compute(np.sqrt(self.dev.state.P_meas)):
+        # NOTE: Clamp at 0 because 'math.sqrt()' raises on negative values,
+        # e.g. on a slightly negative current reading at zero output. A nan
+        # passes through 'max()' and 'math.sqrt()' unchanged.
+        if state.P_source != self._PID_P_source:
+            # Only when changed, which is rarely
+            self._PID_P_source = state.P_source
+            PID.setpoint = math.sqrt(max(self._PID_P_source, 0))
+        if PID.compute(math.sqrt(max(state.P_meas, 0))):
             # New PID output got computed -> send new voltage to PSU
-            if self.dev.PID_power.output < 1:
+            if PID.output < 1:
                 # PSU does not regulate well below 1 V, hence clamp to 0
-                self.dev.PID_power.output = 0
-            if not self.dev.set_V_source(self.dev.PID_power.output):
-                return False
-            # Wait for the set_V_source operation to finish.
-            # Takes ~ 300 ms to complete with wait_for_OPC.
-            if not self.dev.wait_for_OPC():
+                PID.output = 0
+            # NOTE: Do not wait for the operation to finish, which takes ~ 300
+            # ms. Nothing further in this tick depends on it. The
+            # 'wait_for_OPC()' at the start of the next tick synchronizes,
+            # by which time the operation will long have been completed.
+            if not dev.set_V_source(PID.output):
                 return False
 
-        if not self.dev.query_ENA_OCP():
-            return False
-        if not self.dev.query_status_OC():
-            return False
-        if not self.dev.query_status_QC():
-            return False
-        if not self.dev.query_ENA_output():
-            return False
-
         # Explicitly force the output state to off when the output got disabled
         # on a hardware level by a triggered protection or fault.
-        if self.dev.state.ENA_output & (
-            self.dev.state.status_QC_OV
-            | self.dev.state.status_QC_OC
-            | self.dev.state.status_QC_PF
-            | self.dev.state.status_QC_OT
-            | self.dev.state.status_QC_INH
+        if state.ENA_output and (
+            state.status_QC_OV
+            or state.status_QC_OC
+            or state.status_QC_PF
+            or state.status_QC_OT
+            or state.status_QC_INH
         ):
-            self.dev.state.ENA_output = False
-            self.dev.set_ENA_output(False)
+            state.ENA_output = False
+            dev.set_ENA_output(False)
 
         if DEBUG_local:
             tock = time.perf_counter()
-            dprint(f"{self.dev.name}: done in {tock - tick:.3f}")
+            dprint(f"{dev.name}: done in {tock - tick:.3f}")
 
-        # Check if there are errors in the device queue and retrieve all
-        # if any and append these to 'dev.state.all_errors'.
+        # The compound query above already popped one error from the device
+        # queue. Only when there was one, retrieve all others that might be
+        # left and append these to 'dev.state.all_errors'.
         if DEBUG_local:
-            dprint(f"{self.dev.name}: query errors")
+            dprint(f"{dev.name}: query errors")
             tick = time.perf_counter()
-        self.dev.query_all_errors_in_queue()
+        if state.error is not None:
+            state.all_errors.append(state.error)
+            dev.query_all_errors_in_queue()
         if DEBUG_local:
             tock = time.perf_counter()
-            dprint(f"{self.dev.name}: stb done in {tock - tick:.3f}")
+            dprint(f"{dev.name}: stb done in {tock - tick:.3f}")
 
+        self._clear_device = False
         return True
 
     # --------------------------------------------------------------------------
@@ -244,6 +334,9 @@ class Keysight_N8700_qdev(QDeviceIO):
         self.V_source = QtWid.QLineEdit("0.00", **p)
         self.I_source = QtWid.QLineEdit("0.000", **p)
         self.P_source = QtWid.QLineEdit("0.00", **p)
+        set_number_validator(self.V_source)
+        set_number_validator(self.I_source)
+        set_number_validator(self.P_source)
         self.V_source.editingFinished.connect(self.send_V_source_from_textbox)
         self.I_source.editingFinished.connect(self.send_I_source_from_textbox)
         self.P_source.editingFinished.connect(self.set_P_source_from_textbox)
@@ -256,6 +349,7 @@ class Keysight_N8700_qdev(QDeviceIO):
 
         # Protection
         self.OVP_level = QtWid.QLineEdit("0.000", **p)
+        set_number_validator(self.OVP_level)
         self.OVP_level.editingFinished.connect(self.send_OVP_level_from_textbox)
         self.pbtn_ENA_OCP = controls.create_Toggle_button(
             "OFF",
@@ -277,6 +371,15 @@ class Keysight_N8700_qdev(QDeviceIO):
         self.status_OC_CV = controls.create_tiny_error_LED()
         self.status_OC_CC = controls.create_tiny_error_LED()
 
+        # (bit mask, LED) per status register bit. The LEDs are named after
+        # their 'State' member.
+        self._LEDs_QC = [
+            (mask, getattr(self, name)) for name, mask, _ in STATUS_QC_BITS
+        ]
+        self._LEDs_OC = [
+            (mask, getattr(self, name)) for name, mask, _ in STATUS_OC_BITS
+        ]
+
         # Final elements
         self.errors = QtWid.QLineEdit("")
         self.errors.setStyleSheet(controls.SS_TEXTBOX_ERRORS)
@@ -384,6 +487,28 @@ class Keysight_N8700_qdev(QDeviceIO):
         self.grpb = QtWid.QGroupBox(f"{self.dev.name}")
         self.grpb.setLayout(self.grid)
 
+        # Confirmation dialogs. Built once and reused, instead of constructing
+        # and styling a new message box on every button press.
+        self._msgbox_reinit = create_question_box(
+            f"Reinitialize {self.dev.name}",
+            "Are you sure you want reinitialize the power supply?",
+        )
+        self._msgbox_save_defaults = create_question_box(
+            f"Save defaults {self.dev.name}",
+            "Are you sure you want to save the current values:\n\n"
+            "  - Source voltage\n"
+            "  - Source current\n"
+            "  - Source power\n"
+            "  - OVP\n"
+            "  - OCP\n\n"
+            "as default?\n"
+            "These will then automatically be loaded next time.",
+        )
+        self._msgbox_save_result = QtWid.QMessageBox()
+        self._msgbox_save_result.setWindowTitle(
+            f"Save defaults {self.dev.name}"
+        )
+
     # --------------------------------------------------------------------------
     #   update_GUI
     # --------------------------------------------------------------------------
@@ -396,55 +521,68 @@ class Keysight_N8700_qdev(QDeviceIO):
         'all_errors', and it bears no consequences to read wrongly.
         Not locking the mutex might speed up the program.
         """
+        state = self.dev.state
         if self.dev.is_alive:
-            if self.dev.state.ENA_PID:
+            if state.ENA_PID:
                 self.pbtn_ENA_PID.setChecked(True)
                 self.pbtn_ENA_PID.setText("ON")
                 self.V_source.setReadOnly(True)
-                self.V_source.setText(f"{self.dev.state.V_source:.2f}")
+                set_text_if_changed(self.V_source, f"{state.V_source:.2f}")
             else:
                 self.pbtn_ENA_PID.setChecked(False)
                 self.pbtn_ENA_PID.setText("OFF")
                 self.V_source.setReadOnly(False)
 
-            if self.dev.state.status_QC_INH:
+            if state.status_QC_INH:
                 self.V_meas.setText("")
                 self.I_meas.setText("Inhibited")
                 self.I_meas.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
                 self.P_meas.setText("")
             else:
                 # fmt: off
-                self.V_meas.setText(f"{self.dev.state.V_meas:.2f}  V   ")
-                self.I_meas.setText(f"{self.dev.state.I_meas:.3f} A   ")
+                self.V_meas.setText(f"{state.V_meas:.2f}  V   ")
+                self.I_meas.setText(f"{state.I_meas:.3f} A   ")
                 self.I_meas.setAlignment(QtCore.Qt.AlignmentFlag.AlignRight)
-                self.P_meas.setText(f"{self.dev.state.P_meas:.2f}  W   ")
+                self.P_meas.setText(f"{state.P_meas:.2f}  W   ")
                 # fmt: on
 
-            self.pbtn_ENA_output.setChecked(self.dev.state.ENA_output)
+            self.pbtn_ENA_output.setChecked(state.ENA_output)
             if self.pbtn_ENA_output.isChecked():
                 self.pbtn_ENA_output.setText("Output ON")
             else:
                 self.pbtn_ENA_output.setText("Output OFF")
 
-            self.pbtn_ENA_OCP.setChecked(self.dev.state.ENA_OCP)
+            self.pbtn_ENA_OCP.setChecked(state.ENA_OCP)
             if self.pbtn_ENA_OCP.isChecked():
                 self.pbtn_ENA_OCP.setText("ON")
             else:
                 self.pbtn_ENA_OCP.setText("OFF")
 
-            self.status_QC_OV.setChecked(self.dev.state.status_QC_OV)
-            self.status_QC_OC.setChecked(self.dev.state.status_QC_OC)
-            self.status_QC_PF.setChecked(self.dev.state.status_QC_PF)
-            self.status_QC_OT.setChecked(self.dev.state.status_QC_OT)
-            self.status_QC_INH.setChecked(self.dev.state.status_QC_INH)
-            self.status_QC_UNR.setChecked(self.dev.state.status_QC_UNR)
-
-            self.status_OC_WTG.setChecked(self.dev.state.status_OC_WTG)
-            self.status_OC_CV.setChecked(self.dev.state.status_OC_CV)
-            self.status_OC_CC.setChecked(self.dev.state.status_OC_CC)
-
-            self.errors.setReadOnly(self.dev.state.all_errors != [])
-            self.errors.setText(";".join(self.dev.state.all_errors))
+            # Only the LEDs of the status bits that have changed, which is
+            # rarely
+            QC, OC = state.status_QC, state.status_OC
+            shown_QC, shown_OC = self._shown_status
+            if QC != shown_QC or OC != shown_OC:
+                self._shown_status = (QC, OC)
+                changed = QC ^ shown_QC
+                for mask, LED in self._LEDs_QC:
+                    if changed & mask:
+                        LED.setChecked(bool(QC & mask))
+
+                changed = OC ^ shown_OC
+                for mask, LED in self._LEDs_OC:
+                    if changed & mask:
+                        LED.setChecked(bool(OC & mask))
+
+            all_errors = state.all_errors
+            shown_errors, N_shown_errors = self._shown_errors
+            if (
+                all_errors is not shown_errors
+                or len(all_errors) != N_shown_errors
+            ):
+                self._shown_errors = (all_errors, len(all_errors))
+                self.errors.setReadOnly(all_errors != [])
+                self.errors.setText(";".join(all_errors))
 
             self.lbl_update_counter.setText(f"{self.update_counter_DAQ}")
         else:
@@ -454,6 +592,27 @@ class Keysight_N8700_qdev(QDeviceIO):
             self.P_meas.setText("")
             self.grpb.setEnabled(False)
 
+    @Slot()
+    def _throttle_update_GUI(self):
+        """Update the GUI at once, unless it already got updated less than
+        'GUI_UPDATE_INTERVAL_MS' ago. In that case, update it once more when
+        that interval has passed, so that the latest DAQ update always gets
+        shown.
+        """
+        if self._timer_GUI.isActive():
+            self._GUI_update_pending = True
+            return
+
+        self.update_GUI()
+        self._timer_GUI.start()
+
+    @Slot()
+    def _update_GUI_if_pending(self):
+        if self._GUI_update_pending:
+            self._GUI_update_pending = False
+            self.update_GUI()
+            self._timer_GUI.start()
+
     # --------------------------------------------------------------------------
     #   update_GUI_input_field
     # --------------------------------------------------------------------------
@@ -462,10 +621,7 @@ class Keysight_N8700_qdev(QDeviceIO):
     @Slot(int)
     def update_GUI_input_field(self, GUI_input_field=GUI_input_fields.ALL):
         if GUI_input_field == GUI_input_fields.OVP_level:
-            self.OVP_level.setText(f"{self.dev.state.OVP_level:.2f}")
-            self.dev.PID_power.set_output_limits(
-                0, self.dev.state.OVP_level * 0.95
-            )
+            self._update_OVP_level()
 
         elif GUI_input_field == GUI_input_fields.V_source:
             self.V_source.setText(f"{self.dev.state.V_source:.2f}")
@@ -477,15 +633,22 @@ class Keysight_N8700_qdev(QDeviceIO):
             self.P_source.setText(f"{self.dev.state.P_source:.2f}")
 
         else:
-            self.OVP_level.setText(f"{self.dev.state.OVP_level:.2f}")
-            self.dev.PID_power.set_output_limits(
-                0, self.dev.state.OVP_level * 0.95
-            )
+            self._update_OVP_level()
 
             self.V_source.setText(f"{self.dev.state.V_source:.2f}")
             self.I_source.setText(f"{self.dev.state.I_source:.3f}")
             self.P_source.setText(f"{self.dev.state.P_source:.2f}")
 
+    def _update_OVP_level(self):
+        """Show the OVP level and limit the PID output to just below it. Only
+        updates the PID controller when the OVP level has changed since.
+        """
+        OVP_level = self.dev.state.OVP_level
+        self.OVP_level.setText(f"{OVP_level:.2f}")
+        if OVP_level != self._PID_OVP_level:
+            self._PID_OVP_level = OVP_level
+            self.dev.PID_power.set_output_limits(0, OVP_level * 0.95)
+
     # --------------------------------------------------------------------------
     #   GUI functions
     # --------------------------------------------------------------------------
@@ -518,22 +681,10 @@ class Keysight_N8700_qdev(QDeviceIO):
 
     @Slot()
     def process_pbtn_reinit(self):
-        title = f"Reinitialize {self.dev.name}"
-        msg = "Are you sure you want reinitialize the power supply?"
-        msgbox = QtWid.QMessageBox()
-        msgbox.setIcon(QtWid.QMessageBox.Icon.Question)
-        msgbox.setWindowTitle(title)
-        msgbox.setText(msg)
-        msgbox.setStandardButtons(
-            QtWid.QMessageBox.StandardButton.Yes
-            | QtWid.QMessageBox.StandardButton.No
-        )
-        msgbox.setDefaultButton(QtWid.QMessageBox.StandardButton.No)
-        reply = msgbox.exec()
+        reply = self._msgbox_reinit.exec()
 
         if reply == QtWid.QMessageBox.StandardButton.Yes:
-            self.dev.read_config_file()
-            self.add_to_jobs_queue(self.dev.reinitialize)
+            self.add_to_jobs_queue(self.dev.reinitialize_from_config)
             self.add_to_jobs_queue(
                 "signal_GUI_input_field_update", GUI_input_fields.ALL
             )
@@ -543,27 +694,7 @@ class Keysight_N8700_qdev(QDeviceIO):
 
     @Slot()
     def process_pbtn_save_defaults(self):
-        title = f"Save defaults {self.dev.name}"
-        msg = (
-            "Are you sure you want to save the current values:\n\n"
-            "  - Source voltage\n"
-            "  - Source current\n"
-            "  - Source power\n"
-            "  - OVP\n"
-            "  - OCP\n\n"
-            "as default?\n"
-            "These will then automatically be loaded next time."
-        )
-        msgbox = QtWid.QMessageBox()
-        msgbox.setIcon(QtWid.QMessageBox.Icon.Question)
-        msgbox.setWindowTitle(title)
-        msgbox.setText(msg)
-        msgbox.setStandardButtons(
-            QtWid.QMessageBox.StandardButton.Yes
-            | QtWid.QMessageBox.StandardButton.No
-        )
-        msgbox.setDefaultButton(QtWid.QMessageBox.StandardButton.No)
-        reply = msgbox.exec()
+        reply = self._msgbox_save_defaults.exec()
 
         if reply == QtWid.QMessageBox.StandardButton.Yes:
             if self.dev.write_config_file():
@@ -573,68 +704,55 @@ class Keysight_N8700_qdev(QDeviceIO):
                 icon = QtWid.QMessageBox.Icon.Critical
                 msg = f"Failed to save to disk:\n{self.dev.path_config}"
 
-            msgbox = QtWid.QMessageBox()
-            msgbox.setIcon(icon)
-            msgbox.setWindowTitle(title)
-            msgbox.setText(msg)
-            msgbox.exec()
+            self._msgbox_save_result.setIcon(icon)
+            self._msgbox_save_result.setText(msg)
+            self._msgbox_save_result.exec()
+
+    def _send_from_textbox(
+        self,
+        line_edit: QtWid.QLineEdit,
+        set_function: Callable[[float], bool],
+        query_function: Callable[[], bool],
+        GUI_input_field: GUI_input_fields,
+    ):
+        """Send the number entered in 'line_edit' to the device, read back the
+        value the device actually accepted and show that in the GUI. All as
+        jobs, in this order.
+        """
+        value = read_number(line_edit)
+        self.add_to_jobs_queue(set_function, max(value, 0))
+        self.add_to_jobs_queue(query_function)
+        self.add_to_jobs_queue("signal_GUI_input_field_update", GUI_input_field)
+        self.process_jobs_queue()
 
     @Slot()
     def send_V_source_from_textbox(self):
-        try:
-            voltage = float(self.V_source.text())
-        except (TypeError, ValueError):
-            voltage = 0.0
-        except Exception as err:
-            raise err
-
-        self.add_to_jobs_queue(self.dev.set_V_source, max(voltage, 0))
-        self.add_to_jobs_queue(self.dev.query_V_source)
-        self.add_to_jobs_queue(
-            "signal_GUI_input_field_update", GUI_input_fields.V_source
+        self._send_from_textbox(
+            self.V_source,
+            self.dev.set_V_source,
+            self.dev.query_V_source,
+            GUI_input_fields.V_source,
         )
-        self.process_jobs_queue()
 
     @Slot()
     def send_I_source_from_textbox(self):
-        try:
-            current = float(self.I_source.text())
-        except (TypeError, ValueError):
-            current = 0.0
-        except Exception as err:
-            raise err
-
-        self.add_to_jobs_queue(self.dev.set_I_source, max(current, 0))
-        self.add_to_jobs_queue(self.dev.query_I_source)
-        self.add_to_jobs_queue(
-            "signal_GUI_input_field_update", GUI_input_fields.I_source
+        self._send_from_textbox(
+            self.I_source,
+            self.dev.set_I_source,
+            self.dev.query_I_source,
+            GUI_input_fields.I_source,
         )
-        self.process_jobs_queue()
 
     @Slot()
     def set_P_source_from_textbox(self):
-        try:
-            power = float(self.P_source.text())
-        except (TypeError, ValueError):
-            power = 0.0
-        except Exception as err:
-            raise err
-
-        self.dev.state.P_source = max(power, 0)
+        self.dev.state.P_source = max(read_number(self.P_source), 0)
         self.update_GUI_input_field(GUI_input_fields.P_source)
 
     @Slot()
     def send_OVP_level_from_textbox(self):
-        try:
-            OVP_level = float(self.OVP_level.text())
-        except (TypeError, ValueError):
-            OVP_level = 0.0
-        except Exception as err:
-            raise err
-
-        self.add_to_jobs_queue(self.dev.set_OVP_level, OVP_level)
-        self.add_to_jobs_queue(self.dev.query_OVP_level)
-        self.add_to_jobs_queue(
-            "signal_GUI_input_field_update", GUI_input_fields.OVP_level
+        self._send_from_textbox(
+            self.OVP_level,
+            self.dev.set_OVP_level,
+            self.dev.query_OVP_level,
+            GUI_input_fields.OVP_level,
         )
-        self.process_jobs_queue()